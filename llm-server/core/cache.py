@@ -1,11 +1,12 @@
 """Caching functionality for research results."""
 import re
+import asyncio
 import hashlib
-import json
-from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
 from core.config import Config
+from core.cache_store import get_cache_backend
+from core.executor import run_blocking
 
 
 def normalize_cache_field(value: str) -> str:
@@ -24,42 +25,159 @@ def build_cache_key(event_data: dict, mode: str) -> str:
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
 
 
-def _cache_path(cache_key: str) -> Path:
-    """Get the cache file path for a given key."""
-    path = (Config.CACHE_DIR / f"{cache_key}.json").resolve()
-    # Ensure the resolved path stays within the cache directory to avoid traversal
-    resolved_cache = Config.CACHE_DIR.resolve()
-    if resolved_cache not in path.parents and path != resolved_cache:
-        raise ValueError("Invalid cache path")
-    return path
+def build_artist_cache_key(artist: str, field: Optional[str] = None) -> str:
+    """Build an event-independent cache key from the normalized artist name (and optionally a field)."""
+    parts = ["artist", normalize_cache_field(artist)]
+    if field:
+        parts.append(field)
+    base = "|".join(parts)
+    return hashlib.sha256(base.encode("utf-8")).hexdigest()
+
+
+def normalize_search_query(query: str) -> str:
+    """Normalize a web search query so trivially different spellings share a cache entry."""
+    return normalize_cache_field(query).strip(" ?.!")
+
+
+def build_search_cache_key(query: str) -> str:
+    """Build a cache key for a web search result from the normalized query text."""
+    base = "|".join(["search", normalize_search_query(query)])
+    return hashlib.sha256(base.encode("utf-8")).hexdigest()
+
+
+def cache_age_seconds(data: Dict[str, Any]) -> Optional[float]:
+    """Return how long ago an entry was cached, or None if unknown."""
+    cached_at = data.get("cached_at")
+    if not cached_at:
+        return None
+    try:
+        ts = datetime.fromisoformat(cached_at.rstrip("Z")).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return (datetime.now(timezone.utc) - ts).total_seconds()
+
+
+def _utc_timestamp(dt: datetime) -> str:
+    """Format a UTC datetime the way cache metadata stores it (sortable as text)."""
+    return dt.replace(tzinfo=None).isoformat(timespec="microseconds") + "Z"
+
+
+def cache_ttl(mode: str) -> int:
+    """Return the freshness TTL (seconds) for a cache mode."""
+    return Config.CACHE_TTLS.get(mode, Config.CACHE_DEFAULT_TTL)
+
+
+def is_cache_stale(data: Dict[str, Any], ttl: float) -> bool:
+    """Check if an entry is older than its freshness TTL (still servable while revalidating)."""
+    age = cache_age_seconds(data)
+    return age is None or age > ttl
 
 
-def load_cache(cache_key: str) -> Optional[Dict[str, Any]]:
-    """Load cached data if it exists."""
+def _past_event_cutoff() -> str:
+    """Event dates before this (YYYY-MM-DD) are considered past and evicted."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=Config.CACHE_PAST_EVENT_GRACE_DAYS)
+    return cutoff.strftime("%Y-%m-%d")
+
+
+def _is_expired(data: Dict[str, Any]) -> bool:
+    """Check hard expiry metadata (expires_at / past event date)."""
+    expires_at = data.get("expires_at")
+    if expires_at and expires_at < _utc_timestamp(datetime.utcnow()):
+        return True
+    event_date = data.get("event_date")
+    if event_date and event_date < _past_event_cutoff():
+        return True
+    return False
+
+
+def _is_valid_entry(cache_key: str, data: Optional[Dict[str, Any]], max_age: Optional[float]) -> bool:
+    """Check that a stored entry belongs to the key, is young enough and hasn't expired."""
+    if not data or data.get("key") != cache_key:
+        return False
+    if _is_expired(data):
+        return False
+    if max_age is not None:
+        age = cache_age_seconds(data)
+        if age is None or age > max_age:
+            return False
+    return True
+
+
+def load_cache(cache_key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Load cached data if it exists (and is younger than max_age seconds, if given)."""
     try:
-        path = _cache_path(cache_key)
-        if not path.exists():
+        data = get_cache_backend().get(cache_key)
+        if data is not None and _is_expired(data):
+            get_cache_backend().delete(cache_key)
             return None
-        data = json.loads(path.read_text())
-        if data.get("key") != cache_key:
+        if not _is_valid_entry(cache_key, data, max_age):
             return None
         return data
     except Exception:
         return None
 
 
-def save_cache(cache_key: str, payload: Dict[str, Any]):
-    """Save data to cache."""
+def load_cache_many(cache_keys: List[str], max_age: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+    """Load several cache entries in one batched lookup. Missing/invalid keys are omitted."""
     try:
-        path = _cache_path(cache_key)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        found = get_cache_backend().get_many(cache_keys)
+        return {
+            key: data for key, data in found.items()
+            if _is_valid_entry(key, data, max_age)
+        }
+    except Exception:
+        return {}
+
+
+def save_cache(
+    cache_key: str,
+    payload: Dict[str, Any],
+    ttl: Optional[float] = None,
+    event_date: Optional[str] = None,
+    stale_ttl: Optional[float] = None
+):
+    """
+    Save data to cache.
+
+    Args:
+        cache_key: Key to store under
+        payload: JSON-serializable data
+        ttl: Freshness TTL in seconds; the entry is kept for ttl + CACHE_STALE_TTL
+            so it can still be served while it is being revalidated
+        event_date: Event date (YYYY-MM-DD); the entry is evicted once the event is past
+        stale_ttl: Override for the stale window (e.g. 0 for negative-cache entries)
+    """
+    if stale_ttl is None:
+        stale_ttl = Config.CACHE_STALE_TTL
+    try:
+        now = datetime.utcnow()
         payload_with_meta = {
             **payload,
             "key": cache_key,
-            "cached_at": datetime.utcnow().isoformat() + "Z",
+            "cached_at": _utc_timestamp(now),
         }
-        tmp_path = path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(payload_with_meta, indent=2))
-        tmp_path.replace(path)
+        if ttl is not None:
+            payload_with_meta["expires_at"] = _utc_timestamp(now + timedelta(seconds=ttl + stale_ttl))
+        if event_date:
+            payload_with_meta["event_date"] = event_date
+        get_cache_backend().set(cache_key, payload_with_meta)
     except Exception:
         pass
+
+
+def purge_expired_cache() -> int:
+    """Delete expired entries and entries for past events. Returns the number removed."""
+    try:
+        return get_cache_backend().purge(_utc_timestamp(datetime.utcnow()), _past_event_cutoff())
+    except Exception as e:
+        print(f"[cache] Purge failed: {e}")
+        return 0
+
+
+async def run_cache_maintenance():
+    """Periodically purge expired cache entries (runs for the lifetime of the app)."""
+    while True:
+        removed = await run_blocking(purge_expired_cache)
+        if removed:
+            print(f"[cache] Purged {removed} expired entries")
+        await asyncio.sleep(Config.CACHE_PURGE_INTERVAL)
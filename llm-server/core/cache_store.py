@@ -0,0 +1,357 @@
+"""Pluggable storage backends for the research cache."""
+import copy
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, List
+from core.config import Config
+
+
+class CacheBackend:
+    """Interface for cache storage backends. Payloads are JSON-serializable dicts."""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored payload for a key, or None."""
+        raise NotImplementedError
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return stored payloads for several keys (missing keys are omitted)."""
+        result = {}
+        for key in keys:
+            data = self.get(key)
+            if data is not None:
+                result[key] = data
+        return result
+
+    def set(self, key: str, payload: Dict[str, Any]):
+        """Atomically store a payload under a key."""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """Remove a key if present."""
+        raise NotImplementedError
+
+    def purge(self, expires_before: str, event_date_before: str) -> int:
+        """Remove entries whose expires_at / event_date is before the given values. Returns count."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the backend."""
+        pass
+
+
+def _is_purgeable(data: Dict[str, Any], expires_before: str, event_date_before: str) -> bool:
+    """Check an entry's expiry metadata against purge cutoffs."""
+    expires_at = data.get("expires_at")
+    event_date = data.get("event_date")
+    return bool(
+        (expires_at and expires_at < expires_before)
+        or (event_date and event_date < event_date_before)
+    )
+
+
+class JsonFileCacheBackend(CacheBackend):
+    """One pretty-printed JSON file per key in a flat directory (legacy layout)."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        """Get the cache file path for a given key."""
+        path = (self.cache_dir / f"{key}.json").resolve()
+        # Ensure the resolved path stays within the cache directory to avoid traversal
+        resolved_cache = self.cache_dir.resolve()
+        if resolved_cache not in path.parents and path != resolved_cache:
+            raise ValueError("Invalid cache path")
+        return path
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def set(self, key: str, payload: Dict[str, Any]):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2))
+        tmp_path.replace(path)
+
+    def delete(self, key: str):
+        self._path(key).unlink(missing_ok=True)
+
+    def purge(self, expires_before: str, event_date_before: str) -> int:
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            if _is_purgeable(data, expires_before, event_date_before):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def iter_entries(self) -> Iterable[Dict[str, Any]]:
+        """Yield every readable entry in the directory (used for migration)."""
+        for path in sorted(self.cache_dir.glob("*.json")):
+            try:
+                yield json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+
+
+class SqliteCacheBackend(CacheBackend):
+    """Single SQLite database in WAL mode with a primary-key index on the cache key."""
+
+    # Stay well below SQLite's bound-parameter limit for IN (...) queries
+    _BATCH_SIZE = 500
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One shared connection; sqlite3 calls are serialized with a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " cached_at TEXT"
+            ")"
+        )
+        # Expiry columns (added after the initial schema, so migrate older databases)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+        for column in ("expires_at", "event_date"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE cache ADD COLUMN {column} TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache (expires_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_event_date ON cache (event_date)")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM cache WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        keys = list(dict.fromkeys(keys))
+        result = {}
+        for i in range(0, len(keys), self._BATCH_SIZE):
+            batch = keys[i:i + self._BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, payload FROM cache WHERE key IN ({placeholders})", batch
+                ).fetchall()
+            for key, payload in rows:
+                result[key] = json.loads(payload)
+        return result
+
+    def set(self, key: str, payload: Dict[str, Any]):
+        self.set_many([(key, payload)])
+
+    def set_many(self, items: List[tuple]):
+        """Store several (key, payload) pairs in one transaction."""
+        rows = [
+            (key, json.dumps(payload), payload.get("cached_at"), payload.get("expires_at"), payload.get("event_date"))
+            for key, payload in items
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, payload, cached_at, expires_at, event_date)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def purge(self, expires_before: str, event_date_before: str) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at < ? OR event_date < ?",
+                (expires_before, event_date_before)
+            )
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class MemoryLruCacheBackend(CacheBackend):
+    """
+    Bounded in-memory LRU of decoded entries in front of another backend.
+
+    Writes go through to the underlying backend. The LRU is bounded both by
+    entry count and by the approximate serialized size of its entries.
+    """
+
+    def __init__(self, backend: CacheBackend, max_entries: int, max_bytes: int):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (payload, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a memory entry (callers may mutate it) and mark it recently used."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(item[0])
+
+    def _remember(self, key: str, payload: Dict[str, Any]):
+        """Insert/replace an entry and evict least recently used entries over the limits."""
+        size = len(json.dumps(payload))
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (copy.deepcopy(payload), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def _forget(self, key: str):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self._lookup(key)
+        if data is not None:
+            return data
+        data = self.backend.get(key)
+        if data is not None:
+            self._remember(key, data)
+        return data
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            data = self._lookup(key)
+            if data is not None:
+                result[key] = data
+            else:
+                missing.append(key)
+        if missing:
+            found = self.backend.get_many(missing)
+            for key, data in found.items():
+                self._remember(key, data)
+            result.update(found)
+        return result
+
+    def set(self, key: str, payload: Dict[str, Any]):
+        self.backend.set(key, payload)
+        self._remember(key, payload)
+
+    def delete(self, key: str):
+        self._forget(key)
+        self.backend.delete(key)
+
+    def purge(self, expires_before: str, event_date_before: str) -> int:
+        with self._lock:
+            for key, (payload, size) in list(self._entries.items()):
+                if _is_purgeable(payload, expires_before, event_date_before):
+                    del self._entries[key]
+                    self._bytes -= size
+        return self.backend.purge(expires_before, event_date_before)
+
+    def close(self):
+        self.backend.close()
+
+
+_backend: Optional[CacheBackend] = None
+
+
+def create_cache_backend(name: str = None) -> CacheBackend:
+    """Create the cache backend selected by name (defaults to Config.CACHE_BACKEND)."""
+    name = (name or Config.CACHE_BACKEND).lower()
+    if name == "sqlite":
+        backend = SqliteCacheBackend(Config.CACHE_DB_PATH)
+    elif name == "json":
+        backend = JsonFileCacheBackend(Config.CACHE_DIR)
+    else:
+        raise ValueError(f"Unknown cache backend: {name}")
+
+    # Hot entries are served from memory without any filesystem I/O
+    if Config.CACHE_MEMORY_MAX_ENTRIES > 0 and Config.CACHE_MEMORY_MAX_BYTES > 0:
+        backend = MemoryLruCacheBackend(backend, Config.CACHE_MEMORY_MAX_ENTRIES, Config.CACHE_MEMORY_MAX_BYTES)
+    return backend
+
+
+def get_cache_backend() -> CacheBackend:
+    """Return the process-wide cache backend, creating it on first use."""
+    global _backend
+    if _backend is None:
+        _backend = create_cache_backend()
+    return _backend
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Return in-memory cache counters (empty if the memory tier is disabled)."""
+    backend = get_cache_backend()
+    if isinstance(backend, MemoryLruCacheBackend):
+        return backend.stats()
+    return {}
+
+
+def close_cache_backend():
+    """Close the process-wide cache backend."""
+    global _backend
+    if _backend is not None:
+        backend, _backend = _backend, None
+        backend.close()
+
+
+def migrate_json_cache(source: JsonFileCacheBackend, target: SqliteCacheBackend, batch_size: int = 500) -> int:
+    """Import every legacy JSON cache entry into the SQLite backend. Returns the number imported."""
+    imported = 0
+    batch = []
+    for entry in source.iter_entries():
+        key = entry.get("key") if isinstance(entry, dict) else None
+        if not key:
+            continue
+        batch.append((key, entry))
+        if len(batch) >= batch_size:
+            target.set_many(batch)
+            imported += len(batch)
+            batch = []
+    if batch:
+        target.set_many(batch)
+        imported += len(batch)
+    return imported
@@ -18,6 +18,11 @@ class Config:
     AGENTOPS_API_KEY = os.getenv("AGENTOPS_API_KEY")
     SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
     SPOTIFY_CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
+    # Music field: use the Spotify URL directly when exactly one artist has the exact name
+    # (the LLM only runs for ambiguous or missing matches)
+    SPOTIFY_FAST_PATH = os.getenv("SPOTIFY_FAST_PATH", "true").lower() in ("true", "1", "yes")
+    SPOTIFY_TIMEOUT = float(os.getenv("SPOTIFY_TIMEOUT", "10"))
+    SPOTIFY_RESULT_TTL = int(os.getenv("SPOTIFY_RESULT_TTL", "600"))
     
     # Server
     PORT = int(os.getenv("PORT", 8000))
@@ -39,14 +44,128 @@ class Config:
     TEMPERATURE = 0.3
     TEMPERATURE_STRICT = 0.2
     
+    # Max concurrent outbound LLM calls across the whole process (see core/scheduler.py)
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+    
+    # Hedged field research (see core/hedging.py): duplicate calls slower than the
+    # given latency percentile, capped at a fraction of all calls
+    LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "true").lower() in ("true", "1", "yes")
+    LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+    LLM_HEDGE_BUDGET_RATIO = float(os.getenv("LLM_HEDGE_BUDGET_RATIO", "0.1"))
+    LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "5"))
+    LLM_HEDGE_MIN_SAMPLES = 20
+    LLM_HEDGE_WINDOW = 200
+    
+    # Client-side OpenAI rate limits per model (requests / tokens per minute)
+    OPENAI_RPM_LIMITS = {
+        QUICK_MODEL: int(os.getenv("QUICK_MODEL_RPM", "5000")),
+        DETAILED_MODEL: int(os.getenv("DETAILED_MODEL_RPM", "5000")),
+    }
+    OPENAI_TPM_LIMITS = {
+        QUICK_MODEL: int(os.getenv("QUICK_MODEL_TPM", "2000000")),
+        DETAILED_MODEL: int(os.getenv("DETAILED_MODEL_TPM", "450000")),
+    }
+    OPENAI_DEFAULT_RPM = 500
+    OPENAI_DEFAULT_TPM = 200000
+    # 429 handling: retries with jittered exponential backoff (Retry-After is honored)
+    OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "4"))
+    OPENAI_BACKOFF_BASE = float(os.getenv("OPENAI_BACKOFF_BASE", "1.0"))
+    OPENAI_BACKOFF_MAX = float(os.getenv("OPENAI_BACKOFF_MAX", "30"))
+    
+    # OpenAI HTTP connection pool (shared by all handlers)
+    OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+    OPENAI_HTTP2 = os.getenv("OPENAI_HTTP2", "true").lower() in ("true", "1", "yes")
+    OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+    OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "10"))
+    
+    # Tool execution (blocking tools run in a bounded thread pool)
+    TOOL_THREAD_POOL_SIZE = int(os.getenv("TOOL_THREAD_POOL_SIZE", "16"))
+    
+    # What happens to a research stream when its last SSE client disconnects:
+    # "detach" finishes it in the background (results land in the cache and a
+    # reconnecting client re-attaches), "cancel" stops all outstanding work
+    DISCONNECT_POLICIES = {
+        "quick": os.getenv("QUICK_DISCONNECT_POLICY", "detach"),
+        "artists_list": os.getenv("ARTISTS_LIST_DISCONNECT_POLICY", "detach"),
+        "artists_fields": os.getenv("ARTISTS_FIELDS_DISCONNECT_POLICY", "detach"),
+        "full": os.getenv("FULL_DISCONNECT_POLICY", "detach"),
+    }
+    # Detached streams beyond this many are cancelled instead
+    MAX_DETACHED_FLIGHTS = int(os.getenv("MAX_DETACHED_FLIGHTS", "32"))
+    
+    # Searches run once per artist and shared by all field prompts (core/research_context.py)
+    ARTIST_CONTEXT_QUERIES = [q for q in os.getenv("ARTIST_CONTEXT_QUERIES", "{artist} band|{artist} music").split("|") if q]
+    ARTIST_CONTEXT_MAX_CHARS = int(os.getenv("ARTIST_CONTEXT_MAX_CHARS", "4000"))
+    # Only worth it when at least this many field groups are researched for the artist
+    ARTIST_CONTEXT_MIN_GROUPS = 2
+    
+    # Rule-based artist extraction from titles (core/lineup.py); the LLM runs only below this confidence
+    TITLE_PARSER_ENABLED = os.getenv("TITLE_PARSER_ENABLED", "true").lower() in ("true", "1", "yes")
+    TITLE_PARSER_MIN_CONFIDENCE = float(os.getenv("TITLE_PARSER_MIN_CONFIDENCE", "0.8"))
+    
+    # fetch_url page cache: extracted text, zlib-compressed, LRU-bounded by total size.
+    # Pages older than the fresh TTL are revalidated with conditional GETs (ETag / Last-Modified)
+    PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    PAGE_CACHE_FRESH_TTL = int(os.getenv("PAGE_CACHE_FRESH_TTL", "600"))
+    
+    # fetch_url engine (core/fetcher.py): pages are streamed and parsed incrementally; reading
+    # stops at FETCH_MAX_BYTES or once FETCH_MAX_CHARS of text have been extracted
+    FETCH_MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(2 * 1024 * 1024)))
+    FETCH_MAX_CHARS = int(os.getenv("FETCH_MAX_CHARS", "8000"))
+    FETCH_MAX_CONNECTIONS = int(os.getenv("FETCH_MAX_CONNECTIONS", "20"))
+    
+    # DNS cache for the SSRF checks (seconds); failed lookups are retried sooner
+    DNS_CACHE_TTL = int(os.getenv("DNS_CACHE_TTL", "300"))
+    DNS_NEGATIVE_TTL = int(os.getenv("DNS_NEGATIVE_TTL", "30"))
+    DNS_CACHE_MAX_ENTRIES = int(os.getenv("DNS_CACHE_MAX_ENTRIES", "1024"))
+    
     # Timeouts
     # Increased from 25 to 40 seconds to handle complex tool-calling scenarios
     # (multiple tool calls per field can take longer)
     ARTIST_DATAPOINT_TIMEOUT = int(os.getenv("ARTIST_DATAPOINT_TIMEOUT", "40"))
+    FETCH_TIMEOUT = int(os.getenv("FETCH_TIMEOUT", "15"))
+    
+    # Field prompts: return as soon as the useful keys of the streamed JSON answer are complete
+    # (e.g. the URL), and cut the rest of the generation off (false: let it finish in the background)
+    LLM_EARLY_EXIT = os.getenv("LLM_EARLY_EXIT", "true").lower() in ("true", "1", "yes")
+    LLM_STREAM_CUTOFF = os.getenv("LLM_STREAM_CUTOFF", "true").lower() in ("true", "1", "yes")
+    
+    # Cache
+    # Storage backend: "sqlite" (single WAL-mode database) or "json" (legacy one-file-per-key)
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "sqlite")
+    # In-memory LRU of decoded entries in front of the storage backend (0 disables)
+    CACHE_MEMORY_MAX_ENTRIES = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "2000"))
+    CACHE_MEMORY_MAX_BYTES = int(os.getenv("CACHE_MEMORY_MAX_BYTES", str(64 * 1024 * 1024)))
+    # Freshness TTLs (seconds) per cache mode; stale entries are served while being refreshed
+    CACHE_TTLS = {
+        "quick": int(os.getenv("QUICK_CACHE_TTL", str(7 * 24 * 3600))),
+        "artists_list": int(os.getenv("ARTISTS_LIST_CACHE_TTL", str(3 * 24 * 3600))),
+        "artist_fields": int(os.getenv("ARTIST_FIELDS_CACHE_TTL", str(3 * 24 * 3600))),
+    }
+    CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", str(24 * 3600)))
+    # How long past its TTL an entry may still be served stale (stale-while-revalidate window)
+    CACHE_STALE_TTL = int(os.getenv("CACHE_STALE_TTL", str(14 * 24 * 3600)))
+    # Entries for events more than this many days in the past are evicted
+    CACHE_PAST_EVENT_GRACE_DAYS = int(os.getenv("CACHE_PAST_EVENT_GRACE_DAYS", "1"))
+    CACHE_PURGE_INTERVAL = int(os.getenv("CACHE_PURGE_INTERVAL", "3600"))
+    # Event-independent artist knowledge (bio, links...) is shared across events for this long
+    ARTIST_CACHE_TTL = int(os.getenv("ARTIST_CACHE_TTL", str(7 * 24 * 3600)))
+    # Failed field lookups (errors/timeouts) are negatively cached briefly, then retried
+    CACHE_FIELD_ERROR_TTL = int(os.getenv("CACHE_FIELD_ERROR_TTL", "300"))
+    # Web search results are reused for identical (normalized) queries for this long; 0 disables
+    SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", str(3 * 24 * 3600)))
+    
+    # Request/datapoint logs (append-only JSONL, rotated by size)
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+    LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "1.0"))
     
     # Paths
     BASE_DIR = Path(__file__).resolve().parent.parent
     CACHE_DIR = BASE_DIR / "tasks" / "logs" / "cache"
+    CACHE_DB_PATH = Path(os.getenv("CACHE_DB_PATH", str(BASE_DIR / "tasks" / "logs" / "cache.sqlite3")))
     LOGS_DIR = BASE_DIR / "logs"
     
     @classmethod
@@ -0,0 +1,34 @@
+"""Bounded thread pool for blocking tool work (page loading, Spotify, etc.)."""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from core.config import Config
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """Return the process-wide tool thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=Config.TOOL_THREAD_POOL_SIZE,
+            thread_name_prefix="tool",
+        )
+    return _executor
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking function in the tool thread pool without stalling the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_tool_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_tool_executor():
+    """Shut down the tool thread pool (called from the application lifespan)."""
+    global _executor
+    if _executor is not None:
+        executor, _executor = _executor, None
+        executor.shutdown(wait=False, cancel_futures=True)
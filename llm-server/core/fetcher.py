@@ -0,0 +1,250 @@
+"""Async page fetcher: pooled connections, streamed reads with a byte cap, fast text extraction."""
+import os
+import re
+import asyncio
+from typing import Dict, Iterator, Optional
+import httpx
+import httpcore
+from langchain_community.document_loaders.web_base import default_header_template
+from core.config import Config
+from core.executor import run_blocking
+from core.page_cache import get_page_cache, conditional_headers
+from core.security import resolve_safe_host
+
+
+def _lxml_available() -> bool:
+    """Check if the optional lxml package is installed (fast extraction path)."""
+    try:
+        import lxml.etree  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+_HAS_LXML = _lxml_available()
+
+# Same request headers WebBaseLoader sends
+FETCH_HEADERS = {**default_header_template, "User-Agent": os.getenv("USER_AGENT") or default_header_template["User-Agent"]}
+
+# Elements whose text is never page content
+_SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+
+# Elements that end a line of text (inline elements like <a>/<b> are joined without a break)
+_BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "tr", "td", "th", "table", "section", "article",
+    "header", "footer", "nav", "aside", "main", "h1", "h2", "h3", "h4", "h5", "h6",
+    "blockquote", "pre", "dd", "dt", "dl", "figcaption", "hr", "form", "title",
+}
+
+TRUNCATION_MARKER = "\n\n[Content truncated...]"
+
+# Body bytes handed to the parser per worker-thread hop (small pages take a single hop)
+_FEED_BATCH_BYTES = 128 * 1024
+
+# Shared client for page fetches (bound to the loop that created it)
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _normalize_whitespace(text: str) -> str:
+    """Collapse runs of blank lines/spaces so layout whitespace doesn't eat the text budget."""
+    text = re.sub(r"[ \t\r\f\v]+", " ", text)
+    return re.sub(r"\s*\n\s*", "\n", text).strip()
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) > max_chars:
+        return text[:max_chars] + TRUNCATION_MARKER
+    return text
+
+
+class _LxmlExtractor:
+    """Incremental extraction with lxml's pull parser; counts text as the page streams in."""
+
+    def __init__(self, encoding: Optional[str]):
+        from lxml import etree
+        self._etree = etree
+        self._parser = etree.HTMLPullParser(events=("end",), encoding=encoding, no_network=True)
+        self.text_length = 0
+
+    def feed(self, chunk: bytes):
+        self._parser.feed(chunk)
+        for _, element in self._parser.read_events():
+            if not isinstance(element.tag, str) or element.tag.lower() in _SKIP_TAGS:
+                continue
+            # Approximate (tails may still be incomplete) - only used to stop reading early
+            for piece in (element.text, element.tail):
+                if piece:
+                    self.text_length += len(" ".join(piece.split()))
+
+    def _iter_text(self, element) -> Iterator[str]:
+        """Like itertext(), minus non-content elements and with line breaks after blocks."""
+        if element.text:
+            yield element.text
+        for child in element:
+            if isinstance(child.tag, str) and child.tag.lower() not in _SKIP_TAGS:
+                yield from self._iter_text(child)
+                if child.tag.lower() in _BLOCK_TAGS:
+                    yield "\n"
+            if child.tail:
+                yield child.tail
+
+    def close(self) -> str:
+        try:
+            root = self._parser.close()
+        except self._etree.XMLSyntaxError:
+            return ""
+        if root is None:
+            return ""
+        return "".join(self._iter_text(root))
+
+
+class _SoupExtractor:
+    """Fallback when lxml isn't installed: buffer the (capped) body and use BeautifulSoup."""
+
+    def __init__(self, encoding: Optional[str]):
+        self._encoding = encoding
+        self._chunks = []
+        self.text_length = 0  # Unknown until parsed; the byte cap bounds the read
+
+    def feed(self, chunk: bytes):
+        self._chunks.append(chunk)
+
+    def close(self) -> str:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(b"".join(self._chunks), "html.parser", from_encoding=self._encoding)
+        for element in soup(list(_SKIP_TAGS)):
+            element.decompose()
+        for element in soup(list(_BLOCK_TAGS)):
+            element.append("\n")
+        return soup.get_text()
+
+
+def _make_extractor(encoding: Optional[str]):
+    return _LxmlExtractor(encoding) if _HAS_LXML else _SoupExtractor(encoding)
+
+
+def _finish_extraction(extractor, tail: bytes, max_chars: int) -> str:
+    """Feed the last partial batch and extract the text (blocking; run off the event loop)."""
+    if tail:
+        extractor.feed(tail)
+    return _truncate(_normalize_whitespace(extractor.close()), max_chars)
+
+
+class _PinnedNetworkBackend(httpcore.AnyIOBackend):
+    """
+    Validates every new connection (including each redirect hop) against the SSRF rules
+    and connects to the validated address, so the host can't be re-resolved elsewhere
+    between the check and the connection (DNS rebinding).
+
+    Pinning happens below the connection pool: URLs keep their hostname, so pooled
+    connections are keyed by hostname and TLS verifies the certificate for it.
+    """
+
+    async def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None,
+                          local_address: Optional[str] = None, socket_options=None) -> httpcore.AsyncNetworkStream:
+        ip, error_msg = await resolve_safe_host(host)
+        if ip is None:
+            raise ValueError(error_msg)
+        return await super().connect_tcp(
+            ip, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+        )
+
+
+class _PinnedTransport(httpx.AsyncHTTPTransport):
+    """httpx transport whose connection pool dials through _PinnedNetworkBackend."""
+
+    def __init__(self, limits: httpx.Limits):
+        super().__init__(limits=limits)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=_PinnedNetworkBackend(),
+        )
+
+
+def _get_fetch_client() -> httpx.AsyncClient:
+    """Return the shared fetch client, recreating it if the event loop changed."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            headers=FETCH_HEADERS,
+            follow_redirects=True,
+            max_redirects=5,
+            timeout=httpx.Timeout(Config.FETCH_TIMEOUT),
+            transport=_PinnedTransport(limits=httpx.Limits(
+                max_connections=Config.FETCH_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.FETCH_MAX_CONNECTIONS,
+            )),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_fetch_client():
+    """Close the shared fetch client (called from the application lifespan)."""
+    global _client, _client_loop
+    if _client is not None:
+        client, _client, _client_loop = _client, None, None
+        if not client.is_closed:
+            await client.aclose()
+
+
+def _is_text_response(headers: httpx.Headers) -> bool:
+    content_type = headers.get("content-type", "").lower()
+    return not content_type or content_type.startswith("text/") or "html" in content_type or "xml" in content_type
+
+
+async def fetch_page_text(url: str, max_chars: int = None) -> str:
+    """
+    Fetch a page and return its text, reading no more than needed.
+
+    The body is streamed and parsed incrementally in worker threads (in
+    _FEED_BATCH_BYTES batches, so the event loop never parses); reading stops at
+    FETCH_MAX_BYTES or as soon as enough text has been extracted. Results are
+    kept in the page cache and revalidated with conditional GETs.
+    The URL must already be validated; redirect hops are re-checked and pinned by the transport.
+    """
+    max_chars = max_chars or Config.FETCH_MAX_CHARS
+    cache = get_page_cache()
+    cached = cache.get(url)
+    if cached is not None and cache.is_fresh(cached):
+        cache.record_hit()
+        return cached.text
+
+    headers: Dict[str, str] = conditional_headers(cached)
+    async with _get_fetch_client().stream("GET", url, headers=headers) as response:
+        if response.status_code == 304 and cached is not None:
+            cache.touch(url)
+            cache.record_hit(revalidated=True)
+            return cached.text
+        cache.record_miss()
+        if not _is_text_response(response.headers):
+            return f"Error: Unsupported content type {response.headers.get('content-type')} for {url}"
+
+        extractor = _make_extractor(response.charset_encoding)
+        read = 0
+        batch = bytearray()
+        async for chunk in response.aiter_bytes():
+            read += len(chunk)
+            batch += chunk
+            if read >= Config.FETCH_MAX_BYTES:
+                break
+            if len(batch) >= _FEED_BATCH_BYTES:
+                # Parsing is CPU work: keep it off the event loop, a batch at a time
+                await run_blocking(extractor.feed, bytes(batch))
+                batch.clear()
+                # Small margin: the running count can lag the final extraction
+                if extractor.text_length > max_chars * 1.2:
+                    break
+
+    text = await run_blocking(_finish_extraction, extractor, bytes(batch), max_chars)
+    if not text:
+        return f"Error: Could not load content from {url}"
+    # Error pages are returned to the model but never cached
+    if response.is_success:
+        cache.put(url, text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return text
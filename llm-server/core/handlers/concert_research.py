@@ -3,11 +3,26 @@ import json
 from fastapi import HTTPException, Request
 from sse_starlette.sse import EventSourceResponse
 
+from core.config import Config
+from core.cache import build_cache_key
 from core.logging import log_request
+from core.openai_client import get_openai_client
+from core.singleflight import research_flights
 from core.validation import validate_event_data, validate_mode
 from tasks.quick_handler import quick_research_handler
 from tasks.artists_list_handler import artists_list_handler
 from tasks.artists_fields_handler import artists_fields_handler
+from tasks.full_handler import full_research_handler
+
+
+def _build_flight_key(event_data: dict, mode: str, artists_list: list, no_cache: bool) -> str:
+    """Build the single-flight key for a request (cache key + mode + request variant)."""
+    variant = mode
+    if artists_list:
+        variant += "|" + json.dumps(artists_list)
+    if no_cache:
+        variant += "|no_cache"
+    return f"{mode}:{build_cache_key(event_data, variant)}"
 
 
 async def handle_concert_research(
@@ -55,18 +70,24 @@ async def handle_concert_research(
         req_log["artist"] = artist
     log_request(req_log)
 
+    # Shared client owned by the application lifespan
+    client = getattr(request.app.state, "openai_client", None) or get_openai_client()
+
     # Dispatch to appropriate handler based on mode
     # Wrap in a generator that catches any exceptions during handler creation
     async def safe_handler():
         try:
             if mode == "quick":
-                async for item in quick_research_handler(event_data):
+                async for item in quick_research_handler(event_data, client):
                     yield item
             elif mode == "artists_list":
-                async for item in artists_list_handler(event_data):
+                async for item in artists_list_handler(event_data, client):
                     yield item
             elif mode == "artists_fields":
-                async for item in artists_fields_handler(event_data, artists_list):
+                async for item in artists_fields_handler(event_data, artists_list, client):
+                    yield item
+            elif mode == "full":
+                async for item in full_research_handler(event_data, client):
                     yield item
             else:
                 yield {"event": "error", "data": f"Invalid mode: {mode}"}
@@ -77,4 +98,10 @@ async def handle_concert_research(
             traceback.print_exc()
             yield {"event": "error", "data": f"Error: {error_msg}"}
 
-    return EventSourceResponse(safe_handler())
+    # Identical requests in flight at the same time share one computation
+    flight_key = _build_flight_key(event_data, mode, artists_list, no_cache)
+
+    # A client disconnecting mid-stream either cancels the work or leaves it to finish (per mode)
+    on_disconnect = Config.DISCONNECT_POLICIES.get(mode, "cancel")
+
+    return EventSourceResponse(research_flights.stream(flight_key, safe_handler, on_disconnect))
@@ -0,0 +1,148 @@
+"""Request hedging: start a duplicate of a slow call and keep whichever finishes first."""
+import time
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+from core.config import Config
+from core.scheduler import get_llm_scheduler, queue_wait
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+class LatencyTracker:
+    """Rolling window of call latencies for one kind of call."""
+
+    def __init__(self, window: int):
+        self.samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Return the p-th percentile (nearest rank), or None until enough samples exist."""
+        if len(self.samples) < Config.LLM_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(p / 100.0 * len(ordered))) - 1))
+        return ordered[index]
+
+
+class Hedger:
+    """
+    Hedges calls that run past a latency percentile, within a budget.
+
+    The budget caps hedges at LLM_HEDGE_BUDGET_RATIO of primary calls, so
+    hedging only ever adds a bounded fraction of extra cost. Latencies exclude
+    time queued in the LLM scheduler, and no hedge starts while calls are queued:
+    slowness from saturation isn't something a duplicate call can fix.
+    """
+
+    def __init__(self):
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self.primaries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.skipped_budget = 0
+        self.skipped_busy = 0
+
+    def _tracker(self, key: str) -> LatencyTracker:
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = LatencyTracker(Config.LLM_HEDGE_WINDOW)
+            self._trackers[key] = tracker
+        return tracker
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging a call of this kind (None = don't hedge yet)."""
+        threshold = self._tracker(key).percentile(Config.LLM_HEDGE_PERCENTILE)
+        if threshold is None:
+            return None
+        return max(threshold, Config.LLM_HEDGE_MIN_DELAY)
+
+    def _budget_allows(self) -> bool:
+        return self.hedges < self.primaries * Config.LLM_HEDGE_BUDGET_RATIO
+
+    async def _timed(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run one attempt and record its latency (minus time spent queued for scheduler slots)."""
+        # Runs as its own task, so this only meters this attempt's LLM calls
+        queued = [0.0]
+        queue_wait.set(queued)
+        start = time.monotonic()
+        try:
+            return await call()
+        finally:
+            # Cancelled losers are recorded too (as a lower bound), otherwise the
+            # slow tail would drop out of the window and the threshold would sink
+            self._tracker(key).record(time.monotonic() - start - queued[0])
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `call`, starting one duplicate if it is still running after the hedge delay.
+
+        The first attempt to succeed wins and the other is cancelled. If the first
+        attempt to finish raises, the other one is still given a chance to succeed.
+        """
+        self.primaries += 1
+        delay = self.hedge_delay(key) if Config.LLM_HEDGE_ENABLED else None
+        primary = asyncio.create_task(self._timed(key, call))
+        if delay is None:
+            return await primary
+
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                if get_llm_scheduler().has_waiters():
+                    self.skipped_busy += 1
+                elif self._budget_allows():
+                    self.hedges += 1
+                    verbose_print(f"[hedging] {key} still running after {delay:.1f}s, starting hedge")
+                    tasks.add(asyncio.create_task(self._timed(key, call)))
+                else:
+                    self.skipped_budget += 1
+
+            first_error: Optional[BaseException] = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hedge counters and the current hedge delay per call kind."""
+        return {
+            "enabled": Config.LLM_HEDGE_ENABLED,
+            "primaries": self.primaries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "skipped_budget": self.skipped_budget,
+            "skipped_busy": self.skipped_busy,
+            "delays": {
+                key: round(delay, 2) if delay is not None else None
+                for key, delay in ((key, self.hedge_delay(key)) for key in self._trackers)
+            },
+        }
+
+
+_hedger: Optional[Hedger] = None
+
+
+def get_hedger() -> Hedger:
+    """Return the process-wide hedger."""
+    global _hedger
+    if _hedger is None:
+        _hedger = Hedger()
+    return _hedger
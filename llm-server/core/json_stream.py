@@ -0,0 +1,98 @@
+"""Incremental parsing of a streamed JSON answer (top-level object keys as they complete)."""
+import json
+from typing import Any, Dict, Iterable, Optional
+
+
+class StreamingJSONObject:
+    """
+    Feed a model's answer chunk by chunk; `values` holds each top-level key of
+    the JSON object as soon as its value is complete.
+
+    A string value is complete at its closing quote, other values at the next
+    "," or "}". Text before the first "{" (e.g. a ```json fence) is skipped.
+    Values that fail to parse are left out (the full answer is parsed at the end anyway).
+    """
+
+    def __init__(self):
+        self.values: Dict[str, Any] = {}
+        self.closed = False
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+
+    def feed(self, text: str):
+        """Consume the next chunk of the answer."""
+        self._buffer += text
+        buffer = self._buffer
+        while self._pos < len(buffer) and not self.closed:
+            char = buffer[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._end_string(self._pos)
+            elif not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+            elif char == '"':
+                self._in_string = True
+                self._string_start = self._pos
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end_value(self._pos)
+                    self.closed = True
+            elif self._depth == 1:
+                if char == ":":
+                    self._value_start = self._pos + 1
+                elif char == ",":
+                    self._end_value(self._pos)
+            self._pos += 1
+
+    def _end_string(self, end: int):
+        """A string closed at the object's top level: either a key or a complete string value."""
+        raw = self._buffer[self._string_start:end + 1]
+        if self._value_start is None:
+            self._key = self._loads(raw)
+        elif not self._buffer[self._value_start:self._string_start].strip():
+            self._store(raw)
+
+    def _end_value(self, end: int):
+        """A "," or the closing "}" ends the current (non-string) value."""
+        if self._value_start is not None and self._key not in self.values:
+            raw = self._buffer[self._value_start:end].strip()
+            if raw:
+                self._store(raw)
+        self._key = None
+        self._value_start = None
+
+    def _store(self, raw: str):
+        if isinstance(self._key, str):
+            try:
+                self.values[self._key] = json.loads(raw)
+            except json.JSONDecodeError:
+                pass
+
+    @staticmethod
+    def _loads(raw: str) -> Optional[str]:
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+
+    def has_values(self, keys: Iterable[str]) -> bool:
+        """True once every key has a complete, non-null value."""
+        return all(self.values.get(key) is not None for key in keys)
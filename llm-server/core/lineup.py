@@ -0,0 +1,139 @@
+"""Rule-based artist extraction from event titles (fast path before the LLM)."""
+import re
+from typing import List, Tuple
+
+
+# Lineup separators: "A, B", "A w/ B", "A with B", "A + B", "A / B", "A | B", "A feat. B"
+# (captured, so the split keeps track of which separator produced each fragment)
+_SEPARATOR_RE = re.compile(
+    r"(\s*,\s*|\s+\+\s+|\s+/\s+|\s+\|\s+|\s+w/\s*|\s+with\s+|\s+(?:feat\.?|ft\.|featuring)\s+)",
+    re.IGNORECASE,
+)
+
+# Separators that also occur inside band names ("Earth, Wind & Fire", "Florence + The Machine",
+# "Dance With The Dead", "Tyler, The Creator")
+_AMBIGUOUS_SEPARATORS = {",", "+", "with"}
+
+# Venue-style noise that is never part of an artist name
+_NOISE_RES = [
+    re.compile(r"\([^)]*\)|\[[^\]]*\]"),  # (SOLD OUT), (early show), [DJ set]...
+    re.compile(r"\b(?:sold[\s-]*out|cancell?ed|postponed|rescheduled|new date)\b[:!]?", re.IGNORECASE),
+    re.compile(r"\b(?:doors?|show|music)\s*(?:at\s*)?\d{1,2}(?::\d{2})?\s*(?:am|pm)\b", re.IGNORECASE),
+    re.compile(r"\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b", re.IGNORECASE),
+    re.compile(r"\$\d+(?:\.\d{2})?(?:\s*[-/]\s*\$?\d+(?:\.\d{2})?)?(?:\s*(?:adv|dos|door))?", re.IGNORECASE),
+    re.compile(r"\b(?:all[\s-]ages|a/a|\d{2}\s*\+|\d{2}\s*and over)\b", re.IGNORECASE),
+    re.compile(r"^\s*(?:an evening with|a night with|live:)\s+", re.IGNORECASE),
+]
+
+# Words that suggest an event/series name rather than a performer
+_EVENT_WORDS = {
+    "showcase", "festival", "fest", "tribute", "presents", "night", "nights", "party",
+    "christmas", "holiday", "anniversary", "tour", "celebration", "benefit", "open mic",
+    "comedy", "karaoke", "series", "brunch", "jam", "sessions", "residency", "dance party",
+    "release", "show", "concert", "edition", "vol.", "volume", "experience", "revue",
+}
+
+# Lowercase words that can appear inside a name without making it look like prose
+_NAME_CONNECTORS = {"the", "of", "and", "a", "an", "de", "la", "le", "y", "&", "in", "on", "to", "for", "da", "von", "van"}
+
+_MAX_NAME_WORDS = 6
+_MAX_NAME_CHARS = 50
+
+
+def _strip_noise(title: str) -> str:
+    """Remove sold-out markers, times, prices, age limits and bracketed notes."""
+    for pattern in _NOISE_RES:
+        title = pattern.sub(" ", title)
+    return re.sub(r"\s+", " ", title).strip(" -:;,")
+
+
+def _separator_kind(separator: str) -> str:
+    """Normalize a captured separator (" With ", " + ", ", "...) to its kind."""
+    kind = separator.strip().lower()
+    return kind.rstrip(".") if kind else ","
+
+
+def _name_score(name: str) -> float:
+    """Score how much a title fragment looks like a single performer name (0..1)."""
+    words = name.split()
+    if not words:
+        return 0.0
+    score = 1.0
+    lowered = name.lower()
+    if any(re.search(rf"(?<!\w){re.escape(word)}(?!\w)", lowered) for word in _EVENT_WORDS):
+        score *= 0.3
+    if len(words) > _MAX_NAME_WORDS or len(name) > _MAX_NAME_CHARS:
+        score *= 0.4
+    # Prose ("a foothold in jazz") rather than a name: several plain lowercase words
+    prose_words = [w for w in words if w.islower() and w.isalpha() and w not in _NAME_CONNECTORS]
+    if len(prose_words) >= 2 or (len(words) > 1 and len(prose_words) == len(words)):
+        score *= 0.4
+    # Leftover punctuation of a "SERIES - Artist" / "Tour: Artist" style title
+    if re.search(r"\s[-–—]\s|:", name):
+        score *= 0.5
+    return score
+
+
+def _split_score(name: str, separators: List[str], is_list_source: bool) -> float:
+    """
+    Score a fragment by the separators around it: a split on ",", "+" or "with"
+    that leaves a fragment starting with "The", or a single word, probably cut a
+    band name in two ("Florence" + "The Machine", "Earth" + "Wind & Fire").
+    Comma-only splits of list sources are trusted.
+    """
+    if not any(sep in _AMBIGUOUS_SEPARATORS for sep in separators):
+        return 1.0
+    # Scraped lineups (The List) are comma-separated by construction, full of
+    # one-word and "The ..." names
+    commas_only = all(sep == "," for sep in separators if sep in _AMBIGUOUS_SEPARATORS)
+    if is_list_source and commas_only:
+        return 1.0
+    if re.match(r"the\s", name, re.IGNORECASE):
+        return 0.5
+    if len(name.split()) == 1:
+        return 0.7
+    return 1.0
+
+
+def extract_artists_from_title(title: str, is_list_source: bool = False) -> Tuple[List[str], float]:
+    """
+    Split an event title into artist names.
+
+    Args:
+        title: Event title, e.g. "Radiohead, Phoebe Bridgers w/ Special Guest (SOLD OUT)"
+        is_list_source: The title is a scraped lineup (e.g. from The List), i.e. a
+            comma-separated list of performers rather than free-form text
+
+    Returns:
+        (artists, confidence): confidence is 0..1; low values mean the title should
+        be left to the LLM (descriptive titles, series names, festivals...)
+    """
+    cleaned = _strip_noise(title or "")
+    if not cleaned:
+        return [], 0.0
+
+    pieces = _SEPARATOR_RE.split(cleaned)
+    fragments = pieces[0::2]
+    separators = [_separator_kind(sep) for sep in pieces[1::2]]
+
+    artists: List[str] = []
+    scores: List[float] = []
+    for index, part in enumerate(fragments):
+        name = part.strip(" -:;,.")
+        # "special guest(s)" / "more tba" are placeholders, not performers
+        if not name or re.fullmatch(r"(?:(?:and|&)\s+)?(?:very\s+)?(?:special\s+guests?|more\s+tba|tba|tbd|guests?)", name, re.IGNORECASE):
+            continue
+        if name.lower() not in (a.lower() for a in artists):
+            artists.append(name)
+            # Separators on either side of this fragment
+            around = separators[max(0, index - 1):index + 1]
+            scores.append(_name_score(name) * _split_score(name, around, is_list_source))
+    if not artists:
+        return [], 0.0
+
+    confidence = min(scores)
+    if len(artists) == 1 and len(fragments) == 1 and not is_list_source:
+        # A lone name could just as well be a show, musical or series we don't
+        # recognize ("Hamilton", "Salsa Sundays"): always leave those to the LLM
+        confidence *= 0.6
+    return artists, confidence
@@ -1,13 +1,19 @@
 """LLM setup and tool calling utilities."""
 import re
 import json
-from typing import List, Dict, Any, Optional, Callable
+import asyncio
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
-from langchain_core.tools import Tool
 from core.config import Config
+from core.scheduler import get_llm_scheduler, PRIORITY_FIELDS
+from core.llm_limits import call_with_rate_limit, estimate_tokens, get_model_limiter, LLMRateLimited
+from core.hedging import get_hedger
+from core.json_stream import StreamingJSONObject
+
+if TYPE_CHECKING:
+    from core.tools import ToolSet
 
 
 def verbose_print(*args, **kwargs):
@@ -92,184 +98,30 @@ def create_llm(
     )
 
 
-def _extract_tool_args(args: Any) -> Any:
-    """Extract tool arguments, handling various formats from OpenAI."""
-    if isinstance(args, dict):
-        if '__arg1' in args:
-            # OpenAI sometimes uses __arg1 for single positional args
-            return args['__arg1']
-        elif 'query' in args:
-            # Explicit query parameter
-            return args['query']
-        else:
-            # Try unpacking all args
-            return args
-    return args
-
-
-def _call_tool(tool_func: Callable, args: Any, debug: bool = False) -> str:
-    """Call a tool function with extracted arguments."""
-    try:
-        extracted_args = _extract_tool_args(args)
-        
-        if isinstance(extracted_args, dict):
-            result = tool_func(**extracted_args)
-        else:
-            result = tool_func(extracted_args)
-        
-        if debug:
-            result_preview = result[:100] + "..." if len(str(result)) > 100 else result
-            verbose_print(f"    Result: {result_preview}")
-        
-        return str(result)
-    except Exception as e:
-        error_str = str(e)
-        
-        # Check if this is a Serper credits error
-        if _is_serper_credits_error(e):
-            raise SerperCreditsExhausted("Out of Serper Credits")
-        
-        if debug:
-            verbose_print(f"    Error: {e}")
-        
-        return f"(tool error: {e})"
-
-
-async def run_with_tools(
-    llm: ChatOpenAI,
-    tools: List[Tool],
-    prompt: str,
-    debug: bool = False
-) -> str:
-    """Minimal tool-calling loop for ChatOpenAI with LangChain tool schema."""
-    tool_map = {t.name: t for t in tools}
-    messages: List = [HumanMessage(content=prompt)]
-
-    # Bind tools to LLM to avoid AgentOps conflicts
-    llm_with_tools = llm.bind_tools(tools) if tools else llm
-
-    while True:
-        resp: AIMessage = await llm_with_tools.ainvoke(messages)
-        messages.append(resp)
-        
-        tool_calls = getattr(resp, "tool_calls", None)
-        if not tool_calls:
-            # Final content - no more tool calls
-            return resp.content if isinstance(resp.content, str) else str(resp.content)
-        
-        if debug:
-            verbose_print(f"\n🔧 Tool calls detected: {len(tool_calls)}")
-            for i, call in enumerate(tool_calls, 1):
-                name = call.get("name")
-                args = call.get("args") or {}
-                args_str = json.dumps(args, indent=2) if isinstance(args, dict) else str(args)
-                verbose_print(f"  {i}. {name}({args_str})")
-        
-        for call in tool_calls:
-            name = call.get("name")
-            args = call.get("args") or {}
-            
-            if debug:
-                verbose_print(f"  - Executing: {name}")
-            
-            if name not in tool_map:
-                messages.append(ToolMessage(
-                    content="(tool not available)",
-                    tool_call_id=call.get("id")
-                ))
-                continue
-            
-            tool_func = tool_map[name].func
-            result = _call_tool(tool_func, args, debug)
-            
-            messages.append(ToolMessage(
-                content=result,
-                tool_call_id=call.get("id")
-            ))
-
-
-def _build_function_definitions(has_search: bool, tools: List[Tool] = None) -> List[Dict[str, Any]]:
-    """Build OpenAI function definitions based on available tools."""
-    functions = []
-    
-    if has_search and Config.SERPER_API_KEY:
-        functions.append(SEARCH_FUNCTION_DEF)
-    
-    functions.append(FETCH_URL_FUNCTION_DEF)
-    
-    # Only include Spotify function if Spotify tool is in the tools list
-    if tools and any(t.name == "spotify_search_artist" for t in tools):
-        functions.append(SPOTIFY_SEARCH_FUNCTION_DEF)
-    
-    return functions
-
-
 def _is_serper_credits_error(error: Exception) -> bool:
     """Check if an error is a Serper credits exhaustion error."""
     error_str = str(error)
     return "400" in error_str and ("serper" in error_str.lower() or "google.serper.dev" in error_str.lower())
 
 
-def _execute_search_tool(query: str, has_search: bool) -> str:
-    """Execute the search tool and return result or fallback message."""
-    from langchain_community.utilities import GoogleSerperAPIWrapper
-    
-    if not has_search or not Config.SERPER_API_KEY:
-        return f"Web search unavailable. Please provide your best answer based on your training data about: {query}"
-    
-    try:
-        serper = GoogleSerperAPIWrapper(serper_api_key=Config.SERPER_API_KEY)
-        result = serper.run(query)
-        
-        # Log search results for debugging
-        result_preview = str(result)[:500] if result else "(empty)"
-        verbose_print(f"[run_json_prompt] Search result for '{query}': {result_preview}...")
-        
-        if not result or len(str(result)) < 10:
-            return f"Search returned no useful results for '{query}'. Please provide your best answer based on your training data."
-        
-        return result
-    except Exception as e:
-        error_str = str(e)
-        verbose_print(f"[run_json_prompt] Search error for query '{query}': {e}")
-        
-        if _is_serper_credits_error(e):
-            raise SerperCreditsExhausted("Out of Serper Credits")
-        
-        return f"Web search unavailable. Please provide your best answer based on your training data about: {query}"
+async def _execute_tool_call(tool_call: Any, tools: "ToolSet") -> str:
+    """Execute a single tool call without blocking the event loop and return the result."""
+    return await tools.execute(tool_call.function.name, json.loads(tool_call.function.arguments))
 
 
-def _execute_fetch_url_tool(url: str) -> str:
-    """Execute the fetch_url tool and return result or fallback message."""
-    from core.tools import fetch_url_content
+async def _execute_tool_calls(tool_calls: List[Any], tools: "ToolSet") -> List[str]:
+    """Execute all tool calls from one model message concurrently, returning results in order."""
+    if len(tool_calls) == 1:
+        return [await _execute_tool_call(tool_calls[0], tools)]
     
+    tasks = [asyncio.create_task(_execute_tool_call(tc, tools)) for tc in tool_calls]
     try:
-        return fetch_url_content(url)
-    except Exception as e:
-        verbose_print(f"[run_json_prompt] Fetch URL error for '{url}': {e}")
-        return f"URL fetch failed: {str(e)}. Please provide your best answer based on your training data."
-
-
-def _execute_tool_call(tool_call: Any, has_search: bool) -> str:
-    """Execute a single tool call and return the result."""
-    import json as json_lib
-    from core.tools import spotify_search_artist
-    
-    function_name = tool_call.function.name
-    args = json_lib.loads(tool_call.function.arguments)
-    
-    if function_name == "search":
-        return _execute_search_tool(args["query"], has_search)
-    elif function_name == "fetch_url":
-        return _execute_fetch_url_tool(args["url"])
-    elif function_name == "spotify_search_artist":
-        artist_name = args.get("artist_name", "")
-        result = spotify_search_artist(artist_name)
-        # Log Spotify search results for debugging
-        verbose_print(f"[run_json_prompt] Spotify search result for '{artist_name}': {result[:300]}...")
-        return result
-    else:
-        return f"Error: Unknown function {function_name}"
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # One call failed fatally (e.g. SerperCreditsExhausted) - don't leave the others running
+        for task in tasks:
+            task.cancel()
+        raise
 
 
 def _extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
@@ -329,11 +181,186 @@ def _build_tool_result_message(tool_call_id: str, result: str) -> Dict[str, Any]
     }
 
 
+class _ScheduledStream:
+    """
+    A streamed completion that keeps its scheduler slot until it is exhausted or closed.
+
+    The request runs at the provider until the last chunk, so the slot is held
+    for that long. Streams are opened with include_usage; once closed, the
+    token bucket is reconciled from the final usage chunk (if it arrived).
+    """
+
+    def __init__(self, stream: Any, release: Callable[[], None], model: str, estimated_tokens: int):
+        self._stream = stream
+        self._chunks = stream.__aiter__()
+        self._release = release
+        self._model = model
+        self._estimated = estimated_tokens
+        self._usage = None
+        self._closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            chunk = await self._chunks.__anext__()
+        except BaseException:
+            # StopAsyncIteration included: the stream is done either way
+            await self.close()
+            raise
+        if getattr(chunk, "usage", None) is not None:
+            self._usage = chunk.usage
+        return chunk
+
+    async def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._stream.close()
+        finally:
+            self._release()
+            get_model_limiter(self._model).reconcile(
+                self._estimated, getattr(self._usage, "total_tokens", None)
+            )
+
+
+async def create_chat_completion(client: Any, priority: int, rank: int = 0, **kwargs) -> Any:
+    """
+    Create a chat completion under the per-model RPM/TPM limiter (429s and transient
+    errors are retried; LLMRateLimited if 429s persist) and the process-wide LLM scheduler.
+
+    The scheduler slot is held only for the request itself, so a call waiting on the
+    rate limiter or sleeping in backoff doesn't keep other lanes from running. For
+    stream=True the request lasts until the stream is consumed: the returned stream
+    holds the slot until it is exhausted or closed (callers must close it).
+    """
+    estimated = estimate_tokens(kwargs.get("messages", []), kwargs.get("max_tokens"), kwargs.get("tools"))
+    streaming = kwargs.get("stream", False)
+    if streaming:
+        # The final chunk then carries the usage the token bucket is reconciled with
+        kwargs.setdefault("stream_options", {"include_usage": True})
+
+    async def call():
+        scheduler = get_llm_scheduler()
+        await scheduler.acquire(priority, rank)
+        try:
+            response = await client.chat.completions.create(**kwargs)
+        except BaseException:
+            scheduler.release()
+            raise
+        if not streaming:
+            scheduler.release()
+            return response
+        return _ScheduledStream(response, scheduler.release, kwargs["model"], estimated)
+
+    return await call_with_rate_limit(kwargs["model"], estimated, call)
+
+
+class _StreamedFunction:
+    __slots__ = ("name", "arguments")
+
+    def __init__(self):
+        self.name = ""
+        self.arguments = ""
+
+
+class _StreamedToolCall:
+    __slots__ = ("id", "type", "function")
+
+    def __init__(self):
+        self.id = None
+        self.type = "function"
+        self.function = _StreamedFunction()
+
+
+class _StreamedMessage:
+    """Assistant message assembled from stream deltas (same attributes as a non-streamed one)."""
+
+    __slots__ = ("content", "tool_calls")
+
+    def __init__(self, content: Optional[str], tool_calls: Optional[List[_StreamedToolCall]]):
+        self.content = content
+        self.tool_calls = tool_calls
+
+
+# Streams left to finish in the background after an early result (see LLM_STREAM_CUTOFF)
+_draining: set = set()
+
+
+async def _drain(stream: Any):
+    try:
+        async for _ in stream:
+            pass
+    finally:
+        await stream.close()
+
+
+async def _stream_completion(
+    client: Any,
+    priority: int,
+    rank: int,
+    early_keys: Optional[Tuple[str, ...]],
+    **kwargs
+) -> Tuple[_StreamedMessage, Optional[Dict[str, Any]]]:
+    """
+    Stream one completion of the tool loop, assembling content and tool call deltas.
+
+    Returns:
+        (message, early): early is the parsed answer when all early_keys had values
+        before the model finished (the rest of the stream is then cut off or drained
+        in the background); None otherwise
+    """
+    # The stream holds its scheduler slot until it is consumed or closed
+    stream = await create_chat_completion(client, priority, rank, stream=True, **kwargs)
+    content: List[str] = []
+    calls: Dict[int, _StreamedToolCall] = {}
+    parser = StreamingJSONObject() if early_keys else None
+    early = None
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta is None:
+                continue
+            for tc in delta.tool_calls or []:
+                call = calls.setdefault(tc.index, _StreamedToolCall())
+                if tc.id:
+                    call.id = tc.id
+                if tc.function is not None:
+                    call.function.name += tc.function.name or ""
+                    call.function.arguments += tc.function.arguments or ""
+            if delta.content:
+                content.append(delta.content)
+                if parser is not None and not calls:
+                    parser.feed(delta.content)
+                    if parser.has_values(early_keys):
+                        early = dict(parser.values)
+                        break
+    finally:
+        if early is not None and not Config.LLM_STREAM_CUTOFF:
+            # Let the model finish so the keep-alive connection can be reused
+            task = asyncio.create_task(_drain(stream))
+            _draining.add(task)
+            task.add_done_callback(_draining.discard)
+        else:
+            await stream.close()
+
+    tool_calls = [calls[index] for index in sorted(calls)] or None
+    return _StreamedMessage("".join(content) or None, tool_calls), early
+
+
 async def run_json_prompt(
     prompt_text: str,
-    tools: List[Tool],
-    has_search: bool,
-    query_description: str = None
+    tools: "ToolSet",
+    query_description: str = None,
+    client: Any = None,
+    priority: int = PRIORITY_FIELDS,
+    rank: int = 0,
+    hedge_key: str = None,
+    early_keys: Tuple[str, ...] = None
 ) -> Dict[str, Any]:
     """
     Run a JSON-format prompt with OpenAI function calling support.
@@ -341,11 +368,18 @@ async def run_json_prompt(
     
     Args:
         prompt_text: The prompt to send to the LLM
-        tools: List of available tools
-        has_search: Whether search tool is available
+        tools: Tools offered to the model (from the tool registry, see core/tools.py)
         query_description: Optional description for logging (e.g., "YouTube URL for Artist Name")
+        client: Shared AsyncOpenAI client (defaults to the process-wide client)
+        priority: Scheduler priority class for the LLM calls
+        rank: Ordering within the priority class (e.g. artist position in the lineup)
+        hedge_key: Kind of prompt for latency tracking; when set, a run slower than the
+            observed latency percentile is hedged with a duplicate (see core/hedging.py)
+        early_keys: Keys that make up the useful answer (e.g. the URL). The final
+            answer is streamed and returned as soon as they all have values, before
+            the model finishes the rest of the object (see LLM_EARLY_EXIT)
     """
-    from openai import AsyncOpenAI
+    from core.openai_client import get_openai_client
 
     # Log query start (non-verbose)
     if query_description:
@@ -355,13 +389,33 @@ async def run_json_prompt(
         prompt_preview = prompt_text[:60].replace('\n', ' ')
         print(f"  → Querying LLM: {prompt_preview}...")
 
-    client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
-    functions = _build_function_definitions(has_search, tools)
+    client = client or get_openai_client()
+
+    def run_once():
+        return _run_json_prompt_once(prompt_text, tools, client, priority, rank, early_keys)
+
+    if hedge_key:
+        return await get_hedger().run(hedge_key, run_once)
+    return await run_once()
+
+
+async def _run_json_prompt_once(
+    prompt_text: str,
+    tools: "ToolSet",
+    client: Any,
+    priority: int,
+    rank: int,
+    early_keys: Tuple[str, ...] = None
+) -> Dict[str, Any]:
+    """Run the prompt's tool loop once and parse the final JSON response."""
+    functions = tools.schemas
     messages = [{"role": "user", "content": prompt_text}]
+    early_keys = early_keys if Config.LLM_EARLY_EXIT else None
     
     try:
         # Initial completion with function calling enabled
-        completion = await client.chat.completions.create(
+        message, early = await _stream_completion(
+            client, priority, rank, early_keys,
             model=Config.DETAILED_MODEL,
             messages=messages,
             tools=functions if functions else None,
@@ -369,9 +423,7 @@ async def run_json_prompt(
             max_tokens=512,
             temperature=Config.TEMPERATURE_STRICT,
         )
-        
-        message = completion.choices[0].message
-        tool_calls = getattr(message, 'tool_calls', None)
+        tool_calls = message.tool_calls
         
         # Log tool call status with details (verbose only)
         if tool_calls:
@@ -397,16 +449,17 @@ async def run_json_prompt(
             # Add assistant message with tool calls
             messages.append(_build_tool_call_message(message))
             
-            # Execute all tool calls and add results
-            for tool_call in message.tool_calls:
-                result = _execute_tool_call(tool_call, has_search)
+            # Execute all tool calls concurrently and add results in the original order
+            results = await _execute_tool_calls(message.tool_calls, tools)
+            for tool_call, result in zip(message.tool_calls, results):
                 # Log tool result for debugging (verbose only)
                 result_preview = str(result)[:300] if result else "(empty)"
                 verbose_print(f"[run_json_prompt] Tool result for {tool_call.function.name}: {result_preview}...")
                 messages.append(_build_tool_result_message(tool_call.id, result))
             
             # Get next completion
-            completion = await client.chat.completions.create(
+            message, early = await _stream_completion(
+                client, priority, rank, early_keys,
                 model=Config.DETAILED_MODEL,
                 messages=messages,
                 tools=functions if functions else None,
@@ -414,8 +467,11 @@ async def run_json_prompt(
                 max_tokens=512,
                 temperature=Config.TEMPERATURE_STRICT,
             )
-            message = completion.choices[0].message
-            tool_calls = getattr(message, 'tool_calls', None)
+            tool_calls = message.tool_calls
+        
+        if early is not None and not tool_calls:
+            verbose_print(f"[run_json_prompt] Early result: {early}")
+            return early
         
         # Extract and parse final JSON response
         raw = message.content or ""
@@ -431,7 +487,8 @@ async def run_json_prompt(
         
         return {"error": "Failed to parse JSON response"}
         
-    except SerperCreditsExhausted:
+    except (SerperCreditsExhausted, LLMRateLimited):
+        # Throttling must not be turned into a field value (it would get streamed and cached)
         raise
     except Exception as e:
         # Try to salvage JSON from message content if available
@@ -0,0 +1,212 @@
+"""Client-side OpenAI rate limiting: per-model RPM/TPM token buckets with adaptive 429 backoff."""
+import json
+import time
+import random
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from openai import APIConnectionError, APIStatusError, InternalServerError, RateLimitError
+from core.config import Config
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+class LLMRateLimited(Exception):
+    """Raised when OpenAI keeps throttling a call after all retries (result must not be cached)."""
+    pass
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at capacity-per-minute."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        """Consume tokens (may go negative when reconciling under-estimates)."""
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def give(self, amount: float):
+        """Return tokens (e.g. when the estimate was higher than actual usage)."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class ModelRateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter for one model."""
+
+    def __init__(self, model: str, rpm: int, tpm: int):
+        self.model = model
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self.retries = 0
+        self.waited = 0.0
+
+    async def acquire(self, estimated_tokens: int):
+        """Wait until one request and the estimated tokens fit within the limits."""
+        while True:
+            delay = max(
+                self.blocked_until - time.monotonic(),
+                self.requests.wait_time(1),
+                self.tokens.wait_time(estimated_tokens),
+            )
+            if delay <= 0:
+                break
+            self.waited += delay
+            await asyncio.sleep(delay)
+        # No await between the check and the take, so this is atomic on the event loop
+        self.requests.take(1)
+        self.tokens.take(estimated_tokens)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """Correct the token bucket once the real usage is known."""
+        if actual_tokens is None:
+            return
+        diff = estimated_tokens - actual_tokens
+        if diff > 0:
+            self.tokens.give(diff)
+        elif diff < 0:
+            self.tokens.take(-diff)
+
+    def on_rate_limited(self, retry_after: Optional[float]):
+        """Record a 429 and pause new requests for this model."""
+        self.throttled += 1
+        pause = retry_after if retry_after is not None else Config.OPENAI_BACKOFF_BASE
+        self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+
+    def stats(self) -> Dict[str, Any]:
+        self.requests._refill()
+        self.tokens._refill()
+        return {
+            "requests_available": round(self.requests.tokens, 1),
+            "tokens_available": round(self.tokens.tokens),
+            "throttled": self.throttled,
+            "retries": self.retries,
+            "waited_seconds": round(self.waited, 2),
+        }
+
+
+_limiters: Dict[str, ModelRateLimiter] = {}
+
+
+def get_model_limiter(model: str) -> ModelRateLimiter:
+    """Return the limiter for a model (limits from Config, with defaults for unknown models)."""
+    limiter = _limiters.get(model)
+    if limiter is None:
+        limiter = ModelRateLimiter(
+            model,
+            Config.OPENAI_RPM_LIMITS.get(model, Config.OPENAI_DEFAULT_RPM),
+            Config.OPENAI_TPM_LIMITS.get(model, Config.OPENAI_DEFAULT_TPM),
+        )
+        _limiters[model] = limiter
+    return limiter
+
+
+def rate_limit_stats() -> Dict[str, Any]:
+    """Return limiter counters for every model used so far."""
+    return {model: limiter.stats() for model, limiter in _limiters.items()}
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int, tools: Any = None) -> int:
+    """Rough token estimate for a request (~4 characters per token) plus the completion budget."""
+    chars = sum(len(str(m.get("content") or "")) for m in messages)
+    chars += sum(len(json.dumps(m.get("tool_calls"))) for m in messages if m.get("tool_calls"))
+    if tools:
+        chars += len(json.dumps(tools))
+    return chars // 4 + (max_tokens or 0)
+
+
+def _retry_after_seconds(error: RateLimitError) -> Optional[float]:
+    """Read Retry-After (or OpenAI's retry-after-ms) from a 429 response."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def _is_transient(error: Exception) -> bool:
+    """Errors the OpenAI SDK would retry itself: connection errors/timeouts, 408, 409 and 5xx."""
+    if isinstance(error, (APIConnectionError, InternalServerError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code in (408, 409)
+
+
+def _backoff_delay(attempt: int) -> float:
+    backoff = min(Config.OPENAI_BACKOFF_MAX, Config.OPENAI_BACKOFF_BASE * (2 ** attempt))
+    return random.uniform(backoff / 2, backoff)
+
+
+def _is_quota_exhausted(error: RateLimitError) -> bool:
+    """insufficient_quota 429s are billing problems, not throttling - retrying won't help."""
+    return getattr(error, "code", None) == "insufficient_quota"
+
+
+async def call_with_rate_limit(
+    model: str,
+    estimated_tokens: int,
+    call: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Run an OpenAI call under the model's RPM/TPM limits.
+
+    429s honor Retry-After and are retried with jittered exponential backoff;
+    LLMRateLimited is raised once retries are exhausted. Transient errors
+    (connection errors, timeouts, 408/409, 5xx) are retried the same way, since
+    the SDK's own retries are disabled. `call` should only hold scarce resources
+    (e.g. a scheduler slot) for the request itself: the waits and backoff sleeps
+    here happen outside it.
+    """
+    limiter = get_model_limiter(model)
+    for attempt in range(Config.OPENAI_MAX_RETRIES + 1):
+        await limiter.acquire(estimated_tokens)
+        try:
+            result = await call()
+        except RateLimitError as e:
+            if _is_quota_exhausted(e) or attempt >= Config.OPENAI_MAX_RETRIES:
+                raise LLMRateLimited(f"OpenAI rate limit for {model}: {e}") from e
+            retry_after = _retry_after_seconds(e)
+            limiter.on_rate_limited(retry_after)
+            delay = max(retry_after or 0.0, _backoff_delay(attempt))
+            limiter.retries += 1
+            verbose_print(f"[llm_limits] 429 for {model}, retry {attempt + 1} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+        except Exception as e:
+            if not _is_transient(e) or attempt >= Config.OPENAI_MAX_RETRIES:
+                raise
+            delay = _backoff_delay(attempt)
+            limiter.retries += 1
+            verbose_print(f"[llm_limits] {e.__class__.__name__} for {model}, retry {attempt + 1} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+        # Streams have no usage yet; they reconcile from their final chunk when closed
+        usage = getattr(result, "usage", None)
+        limiter.reconcile(estimated_tokens, getattr(usage, "total_tokens", None))
+        return result
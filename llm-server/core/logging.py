@@ -1,9 +1,12 @@
 """Logging and tracing utilities."""
 import os
 import json
+import queue
+import atexit
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 import agentops
 from core.config import Config
 
@@ -47,30 +50,140 @@ def end_trace(trace_obj, end_state: str = "Success"):
         _agentops_end_trace(end_state=end_state)
 
 
+class JsonlLogSink:
+    """
+    Buffered, append-only JSONL log file with size-based rotation.
+
+    Records are queued by the caller (no file I/O on the event loop) and
+    written in batches by a background thread.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, backup_count: int, flush_interval: float):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def write(self, record: dict):
+        """Queue a record for writing."""
+        try:
+            line = json.dumps(record, default=str)
+        except (TypeError, ValueError):
+            return
+        self._ensure_started()
+        self._queue.put(line)
+
+    def flush(self):
+        """Block until every queued record has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Flush and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=f"log-{self.path.name}", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        """Writer loop: wait for a record, then append everything queued in one batch."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line in batch if line is not None]
+            try:
+                if lines:
+                    self._append(lines)
+            except Exception:
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if None in batch:
+                return
+
+    def _append(self, lines: List[str]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            size = f.tell()
+        if size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        """Shift path -> path.1 -> path.2 ... keeping backup_count old files."""
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                src.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backup_count > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+
+
+_sinks: Dict[Path, JsonlLogSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_log_sink(path: Path) -> JsonlLogSink:
+    """Return the shared sink for a log file path."""
+    path = Path(path)
+    with _sinks_lock:
+        sink = _sinks.get(path)
+        if sink is None:
+            sink = JsonlLogSink(path, Config.LOG_MAX_BYTES, Config.LOG_BACKUP_COUNT, Config.LOG_FLUSH_INTERVAL)
+            _sinks[path] = sink
+        return sink
+
+
+def close_log_sinks():
+    """Flush and close all log sinks (called at shutdown)."""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+        _sinks.clear()
+    for sink in sinks:
+        sink.close()
+
+
+atexit.register(close_log_sinks)
+
+
 def log_request(request_data: dict, log_dir: Path = None):
-    """Log a request to a JSON file."""
+    """Append a request record to the requests JSONL log."""
     try:
-        ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
         log_dir = log_dir or Config.LOGS_DIR
-        log_path = log_dir / f"req_{ts}_{os.getpid()}.json"
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        log_path.write_text(json.dumps(request_data, indent=2))
+        record = {"ts": datetime.utcnow().isoformat() + "Z", "pid": os.getpid(), **request_data}
+        get_log_sink(log_dir / "requests.jsonl").write(record)
     except Exception:
         pass
 
 
 def create_datapoint_logger(timestamp: str, run_id: str) -> callable:
-    """Create a datapoint logger function."""
-    log_dir = Config.LOGS_DIR
-    log_dir.mkdir(parents=True, exist_ok=True)
-    dp_log_path = log_dir / f"dp_{timestamp}_{run_id}.log"
+    """Create a datapoint logger function that appends to the shared datapoints JSONL log."""
+    sink = get_log_sink(Config.LOGS_DIR / "datapoints.jsonl")
 
     def log_dp(payload: dict):
         try:
-            if dp_log_path.exists():
-                dp_log_path.write_text(dp_log_path.read_text() + json.dumps(payload) + "\n")
-            else:
-                dp_log_path.write_text(json.dumps(payload) + "\n")
+            sink.write({"run": f"{timestamp}_{run_id}", "ts": datetime.utcnow().isoformat() + "Z", **payload})
         except Exception:
             pass
 
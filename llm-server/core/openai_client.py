@@ -0,0 +1,59 @@
+"""Shared, pooled AsyncOpenAI client for all handlers."""
+from typing import Optional
+import httpx
+from openai import AsyncOpenAI
+from core.config import Config
+
+
+# Process-wide client, owned by the FastAPI lifespan (or created lazily for scripts/tests)
+_client: Optional[AsyncOpenAI] = None
+
+
+def _http2_available() -> bool:
+    """Check if the optional h2 package is installed (required for HTTP/2)."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_openai_client() -> AsyncOpenAI:
+    """Create an AsyncOpenAI client backed by a pooled, keep-alive HTTP client."""
+    http2 = Config.OPENAI_HTTP2 and _http2_available()
+    if Config.OPENAI_HTTP2 and not http2:
+        print("⚠ HTTP/2 requested but 'h2' is not installed, falling back to HTTP/1.1")
+
+    http_client = httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=Config.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Config.OPENAI_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(Config.OPENAI_TIMEOUT, connect=Config.OPENAI_CONNECT_TIMEOUT),
+    )
+    # All retries (429s, timeouts, connection errors, 408/409/5xx) are done by core.llm_limits,
+    # outside the scheduler slot and visible to the rate limiter
+    return AsyncOpenAI(api_key=Config.OPENAI_API_KEY, http_client=http_client, max_retries=0)
+
+
+def init_openai_client() -> AsyncOpenAI:
+    """Create the shared client (called from the application lifespan)."""
+    global _client
+    if _client is None:
+        _client = create_openai_client()
+    return _client
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Return the shared client, creating it lazily if the lifespan hasn't run."""
+    return _client or init_openai_client()
+
+
+async def close_openai_client():
+    """Close the shared client and release its connection pool."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
@@ -0,0 +1,122 @@
+"""In-memory cache of extracted page text for fetch_url, revalidated with conditional GETs."""
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from core.config import Config
+
+
+class CachedPage:
+    """Extracted text of one URL (zlib-compressed) plus its HTTP validators."""
+
+    __slots__ = ("body", "etag", "last_modified", "fetched_at")
+
+    def __init__(self, text: str, etag: Optional[str], last_modified: Optional[str]):
+        self.body = zlib.compress(text.encode("utf-8"))
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = time.monotonic()
+
+    @property
+    def text(self) -> str:
+        return zlib.decompress(self.body).decode("utf-8")
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+def conditional_headers(page: Optional[CachedPage]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers to revalidate a cached page."""
+    headers = {}
+    if page is not None and page.etag:
+        headers["If-None-Match"] = page.etag
+    if page is not None and page.last_modified:
+        headers["If-Modified-Since"] = page.last_modified
+    return headers
+
+
+class PageCache:
+    """
+    LRU of fetched pages bounded by total compressed size.
+
+    Entries younger than `fresh_ttl` are served without any request; older
+    ones are revalidated (If-None-Match / If-Modified-Since) by the fetcher.
+    Only used from the event loop by fetch_page_text, so no lock is needed;
+    stats() just reads counters and is safe from /stats' threadpool.
+    """
+
+    def __init__(self, max_bytes: int, fresh_ttl: float):
+        self.max_bytes = max_bytes
+        self.fresh_ttl = fresh_ttl
+        self._pages: "OrderedDict[str, CachedPage]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for a URL (fresh or not) and mark it recently used."""
+        page = self._pages.get(url)
+        if page is not None:
+            self._pages.move_to_end(url)
+        return page
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return time.monotonic() - page.fetched_at < self.fresh_ttl
+
+    def record_hit(self, revalidated: bool = False):
+        if revalidated:
+            self.revalidated += 1
+        else:
+            self.hits += 1
+
+    def record_miss(self):
+        self.misses += 1
+
+    def touch(self, url: str):
+        """Mark a page fresh again after a 304 Not Modified."""
+        page = self._pages.get(url)
+        if page is not None:
+            page.fetched_at = time.monotonic()
+
+    def put(self, url: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store a page, evicting least recently used pages over the size limit."""
+        page = CachedPage(text, etag, last_modified)
+        old = self._pages.pop(url, None)
+        if old is not None:
+            self._bytes -= old.size
+        if page.size > self.max_bytes:
+            return
+        self._pages[url] = page
+        self._bytes += page.size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._pages.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "pages": len(self._pages),
+            "bytes": self._bytes,
+        }
+
+
+_page_cache: Optional[PageCache] = None
+
+
+def get_page_cache() -> PageCache:
+    """Return the process-wide page cache."""
+    global _page_cache
+    if _page_cache is None:
+        _page_cache = PageCache(Config.PAGE_CACHE_MAX_BYTES, Config.PAGE_CACHE_FRESH_TTL)
+    return _page_cache
@@ -76,11 +76,38 @@ Unable to determine artists
     return prompt
 
 
-def build_youtube_prompt(artist: str) -> str:
+def _search_context_section(search_context: str = None) -> str:
+    """Shared search results for the artist, placed ahead of a field prompt (empty if none)."""
+    if not search_context:
+        return ""
+    return f"""SHARED SEARCH RESULTS (already retrieved with the search tool for this artist):
+{search_context}
+
+Treat these as your first searches. Only call the search tool again if they don't contain what you need.
+
+"""
+
+
+def _search_directive(search_context: str, directive: str) -> str:
+    """
+    A prompt's "use the search tool" line; with shared search results it points at
+    those instead, so the model doesn't repeat searches that were already run.
+    """
+    if not search_context:
+        return directive
+    return ("CRITICAL: Work from the SHARED SEARCH RESULTS above first - extract URLs and facts from them. "
+            "Call the search tool only for queries those results don't already answer.")
+
+
+def build_youtube_prompt(artist: str, search_context: str = None) -> str:
     """Build prompt for finding YouTube URL."""
-    return f"""Find a valid YouTube URL for {artist}. 
+    directive = _search_directive(
+        search_context,
+        "CRITICAL: Use the search tool to find actual YouTube video URLs.",
+    )
+    return _search_context_section(search_context) + f"""Find a valid YouTube URL for {artist}. 
 
-CRITICAL: Use the search tool to find actual YouTube video URLs. Do NOT just return a search URL unless you've thoroughly searched and found nothing.
+{directive} Do NOT just return a search URL unless you've thoroughly searched and found nothing.
 
 SEARCH STRATEGY:
 1. Search for "{artist} music" or "{artist} band music" - this typically yields good results
@@ -114,14 +141,23 @@ If you cannot find any YouTube URL after thorough searching, return:
 Return ONLY JSON, no other text."""
 
 
-def build_bio_genres_prompt(artist: str) -> str:
+def build_bio_genres_prompt(artist: str, search_context: str = None) -> str:
     """Build prompt for finding bio and genres."""
-    return f"""Provide a short bio and genres for {artist}.
-
-CRITICAL: Use tools to find information. Do NOT return "not found" without thoroughly searching.
+    directive = _search_directive(search_context, "CRITICAL: Use tools to find information.")
+    first_step = (
+        f"Check the shared search results above for information about {artist} (search again only if they fall short)"
+        if search_context else f"Use the search tool to find information about {artist}"
+    )
+    search_first = (
+        "Start from the shared search results - don't rely only on training data"
+        if search_context else "ALWAYS use search tool first - don't rely only on training data"
+    )
+    return _search_context_section(search_context) + f"""Provide a short bio and genres for {artist}.
+
+{directive} Do NOT return "not found" without thoroughly searching.
 
 SEARCH STRATEGY:
-1. FIRST: Use the search tool to find information about {artist}
+1. FIRST: {first_step}
    - Search for "{artist} band" or "{artist} music" or "{artist} artist"
    - Look for bio information in search result snippets
    - Extract bio from Wikipedia entries, music platform descriptions, or article previews
@@ -156,7 +192,7 @@ GENRES REQUIREMENTS:
 - If no genres found after thorough search (including fetched pages), return empty array []
 
 IMPORTANT:
-- ALWAYS use search tool first - don't rely only on training data
+- {search_first}
 - If a website/Bandcamp link appears in search results, fetch it to get BOTH bio AND genre information
 - Many artists have bios AND genre information on their Bandcamp pages or personal websites
 - When fetching pages, extract BOTH bio text AND genre tags/descriptions from the content
@@ -169,7 +205,7 @@ Output JSON with keys: bio (string), genres (array of strings).
 Return ONLY JSON, no other text."""
 
 
-def build_website_prompt(artist: str, event_data: Dict[str, str] = None) -> str:
+def build_website_prompt(artist: str, event_data: Dict[str, str] = None, search_context: str = None) -> str:
     """Build prompt for finding website/social links."""
     # Build context string if event data available (for disambiguation only, not as requirement)
     context_str = ""
@@ -186,7 +222,9 @@ def build_website_prompt(artist: str, event_data: Dict[str, str] = None) -> str:
         if context_parts:
             context_str = f"\n\nEvent context: {', '.join(context_parts)}. This can help disambiguate if multiple artists with similar names exist, but don't assume the artist is necessarily based in the same location as the venue."
     
-    return f"""Find an official or information-rich link for {artist}.{context_str}
+    # The strategy below lists searches to run; with shared results most are already done
+    shared_note = f"\n\n{_search_directive(search_context, '')}" if search_context else ""
+    return _search_context_section(search_context) + f"""Find an official or information-rich link for {artist}.{context_str}{shared_note}
 
 CRITICAL SEARCH STRATEGY:
 1. Start with "{artist}" (exact name) - personal websites often appear in the FIRST 1-3 search results
@@ -225,7 +263,7 @@ If nothing trustworthy found after thorough searching, return {{"label": "not_fo
 Return ONLY JSON, no other text."""
 
 
-def build_music_link_prompt(artist: str, event_data: Dict[str, str] = None) -> str:
+def build_music_link_prompt(artist: str, event_data: Dict[str, str] = None, search_context: str = None) -> str:
     """Build prompt for finding music platform links."""
     # Build context string if event data available (for disambiguation only)
     context_str = ""
@@ -242,7 +280,7 @@ def build_music_link_prompt(artist: str, event_data: Dict[str, str] = None) -> s
         if context_parts:
             context_str = f"\n\nEvent context: {', '.join(context_parts)}. This can help disambiguate if multiple artists with similar names exist."
     
-    return f"""Find a valid, working link to {artist}'s music.{context_str}
+    return _search_context_section(search_context) + f"""Find a valid, working link to {artist}'s music.{context_str}
 
 CRITICAL: Do NOT return "not_found" unless you've thoroughly searched all options. Prefer finding ANY valid music link over leaving the field blank.
 
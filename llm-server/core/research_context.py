@@ -0,0 +1,70 @@
+"""Per-request search context shared by all field prompts of an artist."""
+import asyncio
+from typing import Dict, List, Optional
+from core.config import Config
+from core.tools import aserper_search
+from core.llm import SerperCreditsExhausted, _is_serper_credits_error
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+async def _search_for_context(query: str) -> Optional[str]:
+    """Run one context search; None if it failed or found nothing useful."""
+    try:
+        result = await aserper_search(query)
+    except Exception as e:
+        if _is_serper_credits_error(e):
+            raise SerperCreditsExhausted("Out of Serper Credits")
+        verbose_print(f"[research_context] Search failed for '{query}': {e}")
+        return None
+    if not result or len(str(result)) < 10:
+        return None
+    return str(result)
+
+
+class ArtistResearchContext:
+    """
+    Runs a few general searches per artist once and shares the results.
+
+    Every field group of an artist (youtube, bio/genres, website, music) used to
+    start its tool loop with a near-identical "<artist> band" search. The first
+    group to ask for an artist triggers the searches; the others await the same
+    result. Prompts then only need a tool call when the shared results fall short.
+    """
+
+    def __init__(self, has_search: bool):
+        self.enabled = has_search and bool(Config.SERPER_API_KEY) and bool(Config.ARTIST_CONTEXT_QUERIES)
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def get(self, artist: str) -> Optional[str]:
+        """Return the shared search results for an artist (None if unavailable)."""
+        if not self.enabled:
+            return None
+        task = self._tasks.get(artist)
+        if task is None:
+            task = asyncio.create_task(self._build(artist))
+            self._tasks[artist] = task
+        # Shielded so a cancelled field task doesn't cancel the searches the others wait on
+        return await asyncio.shield(task)
+
+    async def _build(self, artist: str) -> Optional[str]:
+        queries = [q.format(artist=artist) for q in Config.ARTIST_CONTEXT_QUERIES]
+        print(f"  → Searching shared context for {artist} ({len(queries)} queries)")
+        results = await asyncio.gather(*(_search_for_context(q) for q in queries))
+        sections: List[str] = [
+            f'Search: "{query}"\n{result}'
+            for query, result in zip(queries, results) if result
+        ]
+        if not sections:
+            return None
+        return "\n\n".join(sections)[:Config.ARTIST_CONTEXT_MAX_CHARS]
+
+    def close(self):
+        """Cancel searches nobody is waiting for any more."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
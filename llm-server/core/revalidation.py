@@ -0,0 +1,49 @@
+"""Background refresh of stale cache entries (stale-while-revalidate)."""
+import asyncio
+from typing import Any, AsyncGenerator, Callable, Dict
+from core.config import Config
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+# Keys currently being refreshed, and strong references to their tasks
+_in_progress: Dict[str, asyncio.Task] = {}
+_stats = {"scheduled": 0, "deduplicated": 0, "failed": 0}
+
+
+def revalidation_stats() -> Dict[str, int]:
+    """Return counters for monitoring."""
+    return {**_stats, "in_progress": len(_in_progress)}
+
+
+async def _drain(key: str, events: AsyncGenerator[Dict[str, Any], None]):
+    """Consume a handler's events so it runs to completion (and saves to cache)."""
+    try:
+        async for event in events:
+            if event.get("event") == "error":
+                _stats["failed"] += 1
+                verbose_print(f"[revalidate] Refresh for key={key} failed: {event.get('data')}")
+    except Exception as e:
+        _stats["failed"] += 1
+        verbose_print(f"[revalidate] Refresh for key={key} raised: {e}")
+    finally:
+        _in_progress.pop(key, None)
+
+
+def revalidate_in_background(key: str, events_factory: Callable[[], AsyncGenerator[Dict[str, Any], None]]):
+    """
+    Refresh a stale cache entry without blocking the response that served it.
+
+    `events_factory` must return a handler generator that bypasses the cache
+    (no_cache=True) and saves its fresh result. At most one refresh runs per key.
+    """
+    if key in _in_progress:
+        _stats["deduplicated"] += 1
+        return
+    _stats["scheduled"] += 1
+    verbose_print(f"[revalidate] Refreshing stale entry key={key}")
+    _in_progress[key] = asyncio.create_task(_drain(key, events_factory()))
@@ -0,0 +1,129 @@
+"""Process-wide scheduler for outbound LLM calls (concurrency cap + priority lanes)."""
+import heapq
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from core.config import Config
+
+
+# Priority classes (lower runs first)
+PRIORITY_QUICK = 0
+PRIORITY_ARTISTS_LIST = 1
+PRIORITY_FIELDS = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_QUICK: "quick",
+    PRIORITY_ARTISTS_LIST: "artists_list",
+    PRIORITY_FIELDS: "fields",
+}
+
+
+# Time the current task spent queued for slots, accumulated into a one-element list by
+# callers that want to tell service time from queueing time (see core/hedging.py)
+queue_wait: ContextVar[Optional[List[float]]] = ContextVar("llm_queue_wait", default=None)
+
+
+class LLMScheduler:
+    """
+    Caps concurrent LLM calls and admits waiters by (priority, rank, arrival order).
+
+    `rank` orders work within a priority class, e.g. the artist's position in a
+    lineup so the earliest artists of a request are researched first.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._lane_stats: Dict[int, Dict[str, float]] = {}
+
+    def _lane(self, priority: int) -> Dict[str, float]:
+        return self._lane_stats.setdefault(priority, {"admitted": 0, "wait_total": 0.0, "wait_max": 0.0})
+
+    async def acquire(self, priority: int, rank: int = 0):
+        """Wait for a free slot."""
+        start = time.monotonic()
+        if self.active < self.max_concurrency and not self._waiters:
+            self.active += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, rank, next(self._seq), future))
+            try:
+                # The slot is handed over by release() (active is not decremented in between)
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Slot was handed to us just as we were cancelled - pass it on
+                    self.release()
+                raise
+        waited = time.monotonic() - start
+        self._record_wait(priority, waited)
+        meter = queue_wait.get()
+        if meter is not None:
+            meter[0] += waited
+
+    def has_waiters(self) -> bool:
+        """True when calls are queued for a slot (the process is saturated)."""
+        return any(not future.done() for _, _, _, future in self._waiters)
+
+    def release(self):
+        """Free a slot, handing it directly to the best waiter if there is one."""
+        while self._waiters:
+            _, _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: int, rank: int = 0) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire(priority, rank)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _record_wait(self, priority: int, waited: float):
+        lane = self._lane(priority)
+        lane["admitted"] += 1
+        lane["wait_total"] += waited
+        lane["wait_max"] = max(lane["wait_max"], waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and wait-time metrics per priority lane."""
+        queued: Dict[int, int] = {}
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                queued[priority] = queued.get(priority, 0) + 1
+        lanes = {}
+        for priority in sorted(set(self._lane_stats) | set(queued)):
+            lane = self._lane(priority)
+            admitted = int(lane["admitted"])
+            lanes[PRIORITY_NAMES.get(priority, str(priority))] = {
+                "queued": queued.get(priority, 0),
+                "admitted": admitted,
+                "avg_wait_ms": round(lane["wait_total"] / admitted * 1000, 1) if admitted else 0.0,
+                "max_wait_ms": round(lane["wait_max"] * 1000, 1),
+            }
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self.active,
+            "queued": sum(queued.values()),
+            "lanes": lanes,
+        }
+
+
+_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Return the process-wide LLM scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = LLMScheduler(Config.LLM_MAX_CONCURRENCY)
+    return _scheduler
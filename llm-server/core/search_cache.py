@@ -0,0 +1,73 @@
+"""Memoized web search: persistent results keyed on normalized query, with in-flight dedupe."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+from core.config import Config
+from core.cache import build_search_cache_key, load_cache, save_cache
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+# Searches currently running, by cache key (identical concurrent queries share one request)
+_in_flight: Dict[str, asyncio.Future] = {}
+_stats = {"hits": 0, "misses": 0, "deduplicated": 0}
+
+
+def search_cache_stats() -> Dict[str, Any]:
+    """Return counters for monitoring."""
+    lookups = _stats["hits"] + _stats["misses"] + _stats["deduplicated"]
+    saved = _stats["hits"] + _stats["deduplicated"]
+    return {
+        **_stats,
+        "in_flight": len(_in_flight),
+        "hit_rate": round(saved / lookups, 3) if lookups else 0.0,
+    }
+
+
+def _settle(key: str, future: asyncio.Future):
+    """Drop a finished search nobody awaited any more (and mark its error as retrieved)."""
+    _in_flight.pop(key, None)
+    if not future.cancelled():
+        future.exception()
+
+
+async def cached_search(query: str, search: Callable[[str], Awaitable[str]]) -> str:
+    """
+    Return the result of `search(query)`, served from cache when possible.
+
+    Only non-empty results are cached (for SEARCH_CACHE_TTL); errors propagate
+    to every caller waiting on the same query and are never cached.
+    """
+    if Config.SEARCH_CACHE_TTL <= 0:
+        return await search(query)
+
+    key = build_search_cache_key(query)
+    cached = load_cache(key, max_age=Config.SEARCH_CACHE_TTL)
+    if cached and "result" in cached:
+        _stats["hits"] += 1
+        verbose_print(f"[search_cache] hit for '{query}'")
+        return cached["result"]
+
+    pending = _in_flight.get(key)
+    if pending is not None:
+        _stats["deduplicated"] += 1
+        # Shielded so one cancelled caller doesn't cancel the search for the others
+        return await asyncio.shield(pending)
+
+    _stats["misses"] += 1
+    future = asyncio.ensure_future(search(query))
+    _in_flight[key] = future
+    try:
+        result = await asyncio.shield(future)
+    finally:
+        if future.done():
+            _in_flight.pop(key, None)
+        else:
+            # This caller was cancelled; forget the search once it settles
+            future.add_done_callback(lambda f: _settle(key, f))
+    if result and len(str(result)) >= 10:
+        save_cache(key, {"query": query, "result": result}, ttl=Config.SEARCH_CACHE_TTL, stale_ttl=0)
+    return result
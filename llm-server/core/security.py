@@ -1,62 +1,201 @@
 """Security utilities for URL validation and SSRF protection."""
+import time
 import socket
+import asyncio
 import ipaddress
+from collections import OrderedDict
 from urllib.parse import urlparse
-from typing import Tuple
+from typing import Any, Dict, List, Tuple, Optional
+from core.config import Config
 
 
-def is_safe_url(url: str) -> Tuple[bool, str]:
+def _check_url_shape(url: str) -> Tuple[Optional[str], str]:
     """
-    Validate URL to prevent SSRF attacks.
-    
+    Validate scheme and hostname.
+
     Returns:
-        Tuple of (is_safe, error_message)
+        Tuple of (hostname, error_message); hostname is None when invalid
     """
+    parsed = urlparse(url)
+
+    # Only allow HTTP/HTTPS
+    if parsed.scheme not in ('http', 'https'):
+        return None, f"Invalid protocol: {parsed.scheme}. Only HTTP/HTTPS allowed."
+
+    # Must have a hostname
+    if not parsed.hostname:
+        return None, "Invalid URL: no hostname found."
+
+    return parsed.hostname, ""
+
+
+def _check_ip(ip: str) -> Tuple[bool, str]:
+    """Check that a resolved IP is not private/reserved."""
     try:
-        parsed = urlparse(url)
+        ip_obj = ipaddress.ip_address(ip)
+
+        # Block private networks
+        if ip_obj.is_private:
+            return False, f"Blocked private IP address: {ip}"
+
+        # Block loopback
+        if ip_obj.is_loopback:
+            return False, f"Blocked loopback address: {ip}"
 
-        # Only allow HTTP/HTTPS
-        if parsed.scheme not in ('http', 'https'):
-            return False, f"Invalid protocol: {parsed.scheme}. Only HTTP/HTTPS allowed."
+        # Block link-local
+        if ip_obj.is_link_local:
+            return False, f"Blocked link-local address: {ip}"
 
-        # Must have a hostname
-        if not parsed.hostname:
-            return False, "Invalid URL: no hostname found."
+        # Block multicast
+        if ip_obj.is_multicast:
+            return False, f"Blocked multicast address: {ip}"
 
-        # Resolve hostname to IP
-        try:
-            ip = socket.gethostbyname(parsed.hostname)
-        except socket.gaierror:
-            return False, f"Cannot resolve hostname: {parsed.hostname}"
+        # Block reserved
+        if ip_obj.is_reserved:
+            return False, f"Blocked reserved address: {ip}"
 
-        # Check if IP is private/reserved
-        try:
-            ip_obj = ipaddress.ip_address(ip)
+    except ValueError:
+        return False, f"Invalid IP address: {ip}"
 
-            # Block private networks
-            if ip_obj.is_private:
-                return False, f"Blocked private IP address: {ip}"
+    return True, ""
 
-            # Block loopback
-            if ip_obj.is_loopback:
-                return False, f"Blocked loopback address: {ip}"
 
-            # Block link-local
-            if ip_obj.is_link_local:
-                return False, f"Blocked link-local address: {ip}"
+class _DnsCache:
+    """
+    Resolved addresses per hostname with a TTL (and a shorter one for failures).
+
+    getaddrinfo doesn't expose record TTLs, so entries live for DNS_CACHE_TTL.
+    Only used from the event loop (lookups run through loop.getaddrinfo), so no
+    lock is needed; stats() just reads counters and is safe from /stats' threadpool.
+    """
 
-            # Block multicast
-            if ip_obj.is_multicast:
-                return False, f"Blocked multicast address: {ip}"
+    def __init__(self, ttl: float, negative_ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        # hostname -> (expires_at, addresses); an empty list caches a failed lookup
+        self._entries: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
 
-            # Block reserved
-            if ip_obj.is_reserved:
-                return False, f"Blocked reserved address: {ip}"
+    def get(self, hostname: str) -> Optional[List[str]]:
+        """Return cached addresses (possibly empty for a failed lookup), or None if unknown/expired."""
+        entry = self._entries.get(hostname)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        self._entries.move_to_end(hostname)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, hostname: str, addresses: List[str]):
+        ttl = self.ttl if addresses else self.negative_ttl
+        self.misses += 1
+        self._entries[hostname] = (time.monotonic() + ttl, addresses)
+        self._entries.move_to_end(hostname)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+_dns_cache = _DnsCache(Config.DNS_CACHE_TTL, Config.DNS_NEGATIVE_TTL, Config.DNS_CACHE_MAX_ENTRIES)
+# Lookups in progress, so concurrent fetches of one host share a single query
+_dns_lookups: Dict[str, asyncio.Task] = {}
+
+
+def dns_cache_stats() -> Dict[str, Any]:
+    """Return DNS cache statistics."""
+    return _dns_cache.stats()
+
+
+def _unique_addresses(infos) -> List[str]:
+    """Deduplicate getaddrinfo results, keeping resolver order."""
+    return list(dict.fromkeys(info[4][0] for info in infos))
+
+
+async def _lookup(hostname: str) -> List[str]:
+    loop = asyncio.get_running_loop()
+    try:
+        addresses = _unique_addresses(await loop.getaddrinfo(hostname, None, type=socket.SOCK_STREAM))
+    except socket.gaierror:
+        addresses = []
+    _dns_cache.put(hostname, addresses)
+    return addresses
 
-        except ValueError:
-            return False, f"Invalid IP address: {ip}"
 
-        return True, ""
+def _lookup_done(hostname: str, task: asyncio.Task):
+    if _dns_lookups.get(hostname) is task:
+        del _dns_lookups[hostname]
+    if not task.cancelled():
+        task.exception()  # Retrieved here so an unawaited failure isn't logged
+
+
+async def _resolve_async(hostname: str) -> List[str]:
+    """Resolve a hostname without blocking the event loop; concurrent lookups share one query."""
+    addresses = _dns_cache.get(hostname)
+    if addresses is not None:
+        return addresses
+    task = _dns_lookups.get(hostname)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_lookup(hostname))
+        task.add_done_callback(lambda t: _lookup_done(hostname, t))
+        _dns_lookups[hostname] = task
+    # Shielded so one cancelled caller doesn't fail the lookup for the others
+    return await asyncio.shield(task)
+
+
+def _check_addresses(hostname: str, addresses: List[str]) -> Tuple[bool, str]:
+    """Every resolved address must be public: one private record is enough to refuse the host."""
+    if not addresses:
+        return False, f"Cannot resolve hostname: {hostname}"
+    for ip in addresses:
+        is_safe, error_msg = _check_ip(ip)
+        if not is_safe:
+            return False, error_msg
+    return True, ""
+
+
+def _literal_ip(hostname: str) -> Optional[str]:
+    """Return the hostname if it is already an IP address (no lookup needed)."""
+    try:
+        return str(ipaddress.ip_address(hostname))
+    except ValueError:
+        return None
+
+
+async def resolve_safe_host(hostname: str) -> Tuple[Optional[str], str]:
+    """
+    Resolve a hostname and validate all of its addresses.
+
+    Returns:
+        Tuple of (ip, error_message); ip is the address to connect to (pinned by
+        the fetcher so the connection can't be re-resolved to a different host),
+        None when the host is unsafe or unresolvable
+    """
+    literal = _literal_ip(hostname)
+    addresses = [literal] if literal else await _resolve_async(hostname)
+    is_safe, error_msg = _check_addresses(hostname, addresses)
+    if not is_safe:
+        return None, error_msg
+    return addresses[0], ""
+
+
+async def is_safe_url_async(url: str) -> Tuple[bool, str]:
+    """
+    Validate URL to prevent SSRF attacks (cached, non-blocking resolution).
+
+    Returns:
+        Tuple of (is_safe, error_message)
+    """
+    try:
+        hostname, error_msg = _check_url_shape(url)
+        if hostname is None:
+            return False, error_msg
+
+        ip, error_msg = await resolve_safe_host(hostname)
+        return ip is not None, error_msg
 
     except Exception as e:
         return False, f"URL validation error: {str(e)}"
@@ -0,0 +1,147 @@
+"""In-process single-flight coalescing of identical in-flight research streams."""
+import asyncio
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+from core.config import Config
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+class _Flight:
+    """One running computation and every SSE event it has emitted so far."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.events: List[Dict[str, Any]] = []
+        self.done = False
+        self.subscribers = 0
+        self.detached = False
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    def publish(self, event: Dict[str, Any]):
+        """Record an event and wake up all subscribers."""
+        self.events.append(event)
+        self._notify()
+
+    def finish(self):
+        """Mark the flight complete and wake up all subscribers."""
+        self.done = True
+        self._notify()
+
+    def _notify(self):
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class SingleFlight:
+    """
+    Registry of in-flight event streams keyed by cache key and mode.
+
+    The first request for a key starts the producer in a background task.
+    Later requests for the same key attach to it, first replaying every
+    event already emitted and then receiving new events as they arrive.
+
+    When the last subscriber disconnects, the flight is either cancelled or
+    detached: a detached flight keeps running in the background (so its
+    results are cached) and stays attachable until it finishes.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.started = 0
+        self.coalesced = 0
+        self.detached_total = 0
+        self.cancelled = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for monitoring."""
+        return {
+            "in_flight": len(self._flights),
+            "detached": self._detached_count(),
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "detached_total": self.detached_total,
+            "cancelled": self.cancelled,
+        }
+
+    def _detached_count(self) -> int:
+        return sum(1 for flight in self._flights.values() if flight.detached)
+
+    async def stream(
+        self,
+        key: str,
+        producer: Callable[[], AsyncGenerator[Dict[str, Any], None]],
+        on_disconnect: str = "cancel"
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Yield the events of the flight for `key`, starting it with `producer` if needed.
+
+        Args:
+            key: Flight key (identical requests share one flight)
+            producer: Factory for the handler's event generator
+            on_disconnect: "detach" or "cancel" - what to do with a running flight
+                once its last subscriber is gone
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(key)
+            self._flights[key] = flight
+            flight.task = asyncio.create_task(self._run(flight, producer()))
+            self.started += 1
+        else:
+            self.coalesced += 1
+            verbose_print(f"[singleflight] Attached to in-flight request key={key} (replaying {len(flight.events)} events)")
+
+        flight.subscribers += 1
+        if flight.detached:
+            flight.detached = False
+            verbose_print(f"[singleflight] Re-attached to detached request key={key}")
+        index = 0
+        try:
+            while True:
+                if index < len(flight.events):
+                    event = flight.events[index]
+                    index += 1
+                    yield event
+                    continue
+                if flight.done:
+                    return
+                await flight._changed.wait()
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done:
+                if on_disconnect == "detach" and self._detached_count() < Config.MAX_DETACHED_FLIGHTS:
+                    # Nobody is listening any more - let it finish so the results get cached
+                    flight.detached = True
+                    self.detached_total += 1
+                    verbose_print(f"[singleflight] Client disconnected, finishing key={key} in the background")
+                else:
+                    # Nobody is listening any more - stop the shared computation
+                    self._forget(flight)
+                    self.cancelled += 1
+                    flight.task.cancel()
+
+    async def _run(self, flight: _Flight, events: AsyncGenerator[Dict[str, Any], None]):
+        """Drive the producer, publishing each event to the flight."""
+        try:
+            async for event in events:
+                flight.publish(event)
+        except Exception as e:
+            flight.publish({"event": "error", "data": f"Error: {str(e) or e.__class__.__name__}"})
+        finally:
+            self._forget(flight)
+            flight.finish()
+            await events.aclose()
+
+    def _forget(self, flight: _Flight):
+        """Remove a flight from the registry so later requests start fresh (and hit the cache)."""
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
+
+
+# Process-wide registry for concert research streams
+research_flights = SingleFlight()
@@ -0,0 +1,176 @@
+"""Async Spotify Web API client (client-credentials flow) with a cached access token."""
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import httpx
+from core.config import Config
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+_TOKEN_URL = "https://accounts.spotify.com/api/token"
+_SEARCH_URL = "https://api.spotify.com/v1/search"
+
+# Refresh the token this long before Spotify says it expires
+_TOKEN_EXPIRY_MARGIN = 60
+
+
+class SpotifyNotConfigured(Exception):
+    """Raised when SPOTIFY_CLIENT_ID / SPOTIFY_CLIENT_SECRET are missing."""
+    pass
+
+
+class SpotifyClient:
+    """
+    Long-lived Spotify client: one pooled HTTP client and one access token for the process.
+
+    The token is requested once and reused until shortly before it expires
+    (instead of an OAuth exchange per search). Search results are kept for a
+    few minutes so the LLM's spotify_search_artist call after a fast-path miss
+    doesn't repeat the same request.
+    """
+
+    def __init__(self, client_id: str, client_secret: str):
+        self._credentials = (client_id, client_secret)
+        self._http = httpx.AsyncClient(timeout=httpx.Timeout(Config.SPOTIFY_TIMEOUT))
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+        self._results: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self.token_requests = 0
+        self.searches = 0
+        self.result_hits = 0
+
+    @property
+    def is_closed(self) -> bool:
+        return self._http.is_closed
+
+    async def _get_token(self, refresh: bool = False) -> str:
+        """Return a valid access token, requesting a new one only when needed."""
+        async with self._token_lock:
+            if refresh or self._token is None or time.monotonic() >= self._token_expires_at:
+                response = await self._http.post(
+                    _TOKEN_URL, data={"grant_type": "client_credentials"}, auth=self._credentials
+                )
+                response.raise_for_status()
+                payload = response.json()
+                self._token = payload["access_token"]
+                self._token_expires_at = time.monotonic() + payload.get("expires_in", 3600) - _TOKEN_EXPIRY_MARGIN
+                self.token_requests += 1
+                verbose_print("[spotify] Fetched new access token")
+            return self._token
+
+    async def search_artists(self, artist_name: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search artists by name; returns Spotify's artist objects (best match first)."""
+        key = artist_name.strip().lower()
+        cached = self._results.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.result_hits += 1
+            return cached[1]
+
+        params = {"q": f'artist:"{artist_name}"', "type": "artist", "limit": limit}
+        token = await self._get_token()
+        response = await self._http.get(_SEARCH_URL, params=params, headers={"Authorization": f"Bearer {token}"})
+        if response.status_code == 401:
+            # Token revoked or expired early: refresh once and retry
+            token = await self._get_token(refresh=True)
+            response = await self._http.get(_SEARCH_URL, params=params, headers={"Authorization": f"Bearer {token}"})
+        response.raise_for_status()
+        self.searches += 1
+
+        artists = (response.json().get("artists") or {}).get("items") or []
+        self._results[key] = (time.monotonic() + Config.SPOTIFY_RESULT_TTL, artists)
+        while len(self._results) > 512:
+            self._results.popitem(last=False)
+        return artists
+
+    async def aclose(self):
+        await self._http.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"token_requests": self.token_requests, "searches": self.searches, "result_hits": self.result_hits}
+
+
+_client: Optional[SpotifyClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_spotify_client() -> SpotifyClient:
+    """Return the shared Spotify client, recreating it if the event loop changed."""
+    global _client, _client_loop
+    if not (Config.SPOTIFY_CLIENT_ID and Config.SPOTIFY_CLIENT_SECRET):
+        raise SpotifyNotConfigured(
+            "Spotify credentials not configured. Please set SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET in .env file."
+        )
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = SpotifyClient(Config.SPOTIFY_CLIENT_ID, Config.SPOTIFY_CLIENT_SECRET)
+        _client_loop = loop
+    return _client
+
+
+async def close_spotify_client():
+    """Close the shared Spotify client (called from the application lifespan)."""
+    global _client, _client_loop
+    if _client is not None:
+        client, _client, _client_loop = _client, None, None
+        if not client.is_closed:
+            await client.aclose()
+
+
+def spotify_stats() -> Dict[str, Any]:
+    """Return token/search counters of the shared client."""
+    return _client.stats() if _client is not None else {}
+
+
+def exact_matches(artists: List[Dict[str, Any]], artist_name: str) -> List[Dict[str, Any]]:
+    """Return the search results whose name equals the artist name (case-insensitive)."""
+    wanted = artist_name.strip().casefold()
+    return [a for a in artists if a.get("name", "").strip().casefold() == wanted]
+
+
+def format_search_result(artist_name: str, artists: List[Dict[str, Any]]) -> str:
+    """Describe search results the way the spotify_search_artist tool reports them to the LLM."""
+    if not artists:
+        return f"No Spotify results found for '{artist_name}'"
+
+    matches = exact_matches(artists, artist_name)
+    if matches:
+        exact_match = matches[0]
+        spotify_url = exact_match['external_urls'].get('spotify')
+        if spotify_url:
+            return f"Found exact match: {exact_match['name']} - {spotify_url}"
+        return f"Found exact match: {exact_match['name']} but no URL available"
+
+    # If no exact match, return top results for verification
+    top_results = []
+    for artist in artists[:3]:
+        name = artist['name']
+        url = artist['external_urls'].get('spotify', 'N/A')
+        top_results.append(f"{name}: {url}")
+    return f"No exact match found for '{artist_name}'. Top results: {'; '.join(top_results)}"
+
+
+async def find_unambiguous_artist_url(artist_name: str) -> Optional[str]:
+    """
+    Return the Spotify URL when exactly one search result has the artist's exact name.
+
+    None means "ask the LLM": no exact match, several artists sharing the name,
+    Spotify not configured or the request failed.
+    """
+    try:
+        artists = await get_spotify_client().search_artists(artist_name)
+    except SpotifyNotConfigured:
+        return None
+    except Exception as e:
+        verbose_print(f"[spotify] Search failed for '{artist_name}': {e}")
+        return None
+    matches = exact_matches(artists, artist_name)
+    if len(matches) != 1:
+        return None
+    return matches[0].get("external_urls", {}).get("spotify")
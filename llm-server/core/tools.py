@@ -1,17 +1,40 @@
 """Tool setup and utilities for LLM interactions."""
-from typing import List, Dict, Any
-from langchain_core.tools import Tool
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import aiohttp
 from langchain_community.utilities import GoogleSerperAPIWrapper
-from langchain_community.document_loaders import WebBaseLoader
 from core.config import Config
-from core.security import is_safe_url
-
-
-def fetch_url_content(url: str) -> str:
-    """Fetch and extract text content from a URL with SSRF protection."""
+from core.security import is_safe_url_async
+from core.search_cache import cached_search
+from core.fetcher import fetch_page_text, close_fetch_client
+from core.spotify import SpotifyNotConfigured, get_spotify_client, close_spotify_client, format_search_result
+from core.llm import (
+    SEARCH_FUNCTION_DEF,
+    FETCH_URL_FUNCTION_DEF,
+    SPOTIFY_SEARCH_FUNCTION_DEF,
+    SerperCreditsExhausted,
+    _is_serper_credits_error,
+)
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+# Shared aiohttp session for async Serper searches (bound to the loop that created it)
+_serper_session: Optional[aiohttp.ClientSession] = None
+_serper_session_loop: Optional[asyncio.AbstractEventLoop] = None
+# Serper wrapper bound to that session (rebuilt only when the session is)
+_serper_wrapper: Optional[GoogleSerperAPIWrapper] = None
+
+
+async def afetch_url_content(url: str) -> str:
+    """Fetch and extract text content from a URL with SSRF protection (streamed, pinned fetch in core/fetcher.py)."""
     try:
         # Validate URL for SSRF protection
-        is_safe, error_msg = is_safe_url(url)
+        is_safe, error_msg = await is_safe_url_async(url)
         if not is_safe:
             return f"Error: {error_msg}"
 
@@ -19,113 +42,172 @@ def fetch_url_content(url: str) -> str:
         if 'foopee.com' in url.lower():
             return "Error: foopee.com blocks web scrapers. Please use web search instead."
 
-        loader = WebBaseLoader(url)
-        docs = loader.load()
+        return await fetch_page_text(url)
+    except Exception as e:
+        return f"Error fetching URL: {str(e)}"
 
-        if not docs:
-            return f"Error: Could not load content from {url}"
 
-        # Combine all document content
-        content = '\n\n'.join([doc.page_content for doc in docs])
+def _get_serper_wrapper() -> GoogleSerperAPIWrapper:
+    """Return the shared Serper wrapper and aiohttp session, recreating them if the event loop changed."""
+    global _serper_session, _serper_session_loop, _serper_wrapper
+    loop = asyncio.get_running_loop()
+    if _serper_session is None or _serper_session.closed or _serper_session_loop is not loop:
+        _serper_session = aiohttp.ClientSession()
+        _serper_session_loop = loop
+        # raise_for_status is enabled when an aiosession is supplied, so credit errors (400) surface as exceptions
+        _serper_wrapper = GoogleSerperAPIWrapper(serper_api_key=Config.SERPER_API_KEY, aiosession=_serper_session)
+    return _serper_wrapper
 
-        # Truncate if too long (keep first 8000 chars)
-        if len(content) > 8000:
-            content = content[:8000] + "\n\n[Content truncated...]"
 
-        return content
-    except Exception as e:
-        return f"Error fetching URL: {str(e)}"
+async def _serper_search_uncached(query: str) -> str:
+    """Run a Serper web search using native async HTTP."""
+    return await _get_serper_wrapper().arun(query)
 
 
-def spotify_search_artist(artist_name: str) -> str:
-    """Search Spotify for an artist by name and return the artist URL if exact match found."""
+async def aserper_search(query: str) -> str:
+    """Run a Serper web search, memoized on the normalized query (see core/search_cache.py)."""
+    return await cached_search(query, _serper_search_uncached)
+
+
+async def close_tool_sessions():
+    """Close shared tool HTTP sessions (called from the application lifespan)."""
+    global _serper_session, _serper_session_loop, _serper_wrapper
+    await close_fetch_client()
+    await close_spotify_client()
+    if _serper_session is not None:
+        session, _serper_session, _serper_session_loop, _serper_wrapper = _serper_session, None, None, None
+        if not session.closed:
+            await session.close()
+
+
+async def aspotify_search_artist(artist_name: str) -> str:
+    """Search Spotify for an artist by name and return the artist URL if exact match found (core/spotify.py)."""
     try:
-        import spotipy
-        from spotipy.oauth2 import SpotifyClientCredentials
-        
-        # Use client credentials flow (no user auth needed for search)
-        client_id = Config.SPOTIFY_CLIENT_ID
-        client_secret = Config.SPOTIFY_CLIENT_SECRET
-        
-        if client_id and client_secret:
-            auth_manager = SpotifyClientCredentials(client_id=client_id, client_secret=client_secret)
-            sp = spotipy.Spotify(auth_manager=auth_manager)
-        else:
-            # Without credentials, Spotify API requires authentication
-            return f"Error: Spotify credentials not configured. Please set SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET in .env file."
-        
-        # Search for artist
-        results = sp.search(q=f'artist:"{artist_name}"', type='artist', limit=10)
-        
-        if not results or not results.get('artists') or not results['artists'].get('items'):
-            return f"No Spotify results found for '{artist_name}'"
-        
-        artists = results['artists']['items']
-        
-        # Look for exact name match (case-insensitive)
-        exact_match = None
-        for artist in artists:
-            if artist['name'].lower() == artist_name.lower():
-                exact_match = artist
-                break
-        
-        if exact_match:
-            # Return the Spotify URL
-            spotify_url = exact_match['external_urls'].get('spotify')
-            if spotify_url:
-                return f"Found exact match: {exact_match['name']} - {spotify_url}"
-            else:
-                return f"Found exact match: {exact_match['name']} but no URL available"
-        
-        # If no exact match, return top results for verification
-        top_results = []
-        for artist in artists[:3]:
-            name = artist['name']
-            url = artist['external_urls'].get('spotify', 'N/A')
-            top_results.append(f"{name}: {url}")
-        
-        return f"No exact match found for '{artist_name}'. Top results: {'; '.join(top_results)}"
-        
+        artists = await get_spotify_client().search_artists(artist_name)
+        return format_search_result(artist_name, artists)
+    except SpotifyNotConfigured as e:
+        return f"Error: {e}"
     except Exception as e:
         return f"Error searching Spotify: {str(e)}"
 
 
-def build_tools() -> List[Tool]:
-    """Build and return available tools for LLM."""
-    tools: List[Tool] = []
-
-    # Add URL fetching tool
-    tools.append(
-        Tool(
-            name="fetch_url",
-            func=fetch_url_content,
-            description="Fetch and extract text content from a URL. Input: a URL string. Returns the page content as text. Note: foopee.com URLs will fail (use search instead)."
-        )
-    )
-
-    # Add Serper search tool if available
-    if Config.SERPER_API_KEY:
-        serper = GoogleSerperAPIWrapper(serper_api_key=Config.SERPER_API_KEY)
-        tools.append(
-            Tool(
-                name="search",
-                func=serper.run,
-                description="Search the web for info about artists, events, venues. Input: a search query string."
-            )
-        )
-    
-    # Add Spotify search tool
-    tools.append(
-        Tool(
-            name="spotify_search_artist",
-            func=spotify_search_artist,
-            description="Search Spotify for an artist by exact name. Input: artist name as a string. Returns the Spotify artist URL if an exact name match is found. Use this for finding Spotify links - it's more reliable than web search."
-        )
-    )
-
-    return tools
-
-
-def has_search_tool(tools: List[Tool]) -> bool:
-    """Check if search tool is available."""
-    return any(t.name == "search" for t in tools)
+# Extra tools offered only to some field groups (every group gets search and fetch_url)
+GROUP_EXTRA_TOOLS = {
+    "music": ("spotify_search_artist",),
+}
+
+
+async def _execute_search(args: Dict[str, Any]) -> str:
+    """Execute the search tool and return result or fallback message."""
+    query = args.get("query", "")
+    if not Config.SERPER_API_KEY:
+        return f"Web search unavailable. Please provide your best answer based on your training data about: {query}"
+
+    try:
+        result = await aserper_search(query)
+
+        # Log search results for debugging
+        result_preview = str(result)[:500] if result else "(empty)"
+        verbose_print(f"[run_json_prompt] Search result for '{query}': {result_preview}...")
+
+        if not result or len(str(result)) < 10:
+            return f"Search returned no useful results for '{query}'. Please provide your best answer based on your training data."
+
+        return result
+    except Exception as e:
+        verbose_print(f"[run_json_prompt] Search error for query '{query}': {e}")
+
+        if _is_serper_credits_error(e):
+            raise SerperCreditsExhausted("Out of Serper Credits")
+
+        return f"Web search unavailable. Please provide your best answer based on your training data about: {query}"
+
+
+async def _execute_fetch_url(args: Dict[str, Any]) -> str:
+    """Execute the fetch_url tool and return result or fallback message."""
+    url = args.get("url", "")
+    try:
+        return await afetch_url_content(url)
+    except Exception as e:
+        verbose_print(f"[run_json_prompt] Fetch URL error for '{url}': {e}")
+        return f"URL fetch failed: {str(e)}. Please provide your best answer based on your training data."
+
+
+async def _execute_spotify_search(args: Dict[str, Any]) -> str:
+    """Execute the spotify_search_artist tool."""
+    artist_name = args.get("artist_name", "")
+    result = await aspotify_search_artist(artist_name)
+    # Log Spotify search results for debugging
+    verbose_print(f"[run_json_prompt] Spotify search result for '{artist_name}': {result[:300]}...")
+    return result
+
+
+_EXECUTORS: Dict[str, Callable[[Dict[str, Any]], Awaitable[str]]] = {
+    "search": _execute_search,
+    "fetch_url": _execute_fetch_url,
+    "spotify_search_artist": _execute_spotify_search,
+}
+
+_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "search": SEARCH_FUNCTION_DEF,
+    "fetch_url": FETCH_URL_FUNCTION_DEF,
+    "spotify_search_artist": SPOTIFY_SEARCH_FUNCTION_DEF,
+}
+
+
+class ToolSet:
+    """The tools offered to one kind of prompt: prebuilt OpenAI schemas plus async executors."""
+
+    __slots__ = ("names", "schemas")
+
+    def __init__(self, names: Tuple[str, ...]):
+        self.names = names
+        self.schemas: List[Dict[str, Any]] = [_SCHEMAS[name] for name in names]
+
+    @property
+    def has_search(self) -> bool:
+        return "search" in self.names
+
+    async def execute(self, name: str, args: Dict[str, Any]) -> str:
+        """Run one tool call; tools outside this set are refused."""
+        if name not in self.names:
+            if name == "search":
+                # Search was not offered (no Serper key) - steer the model back to its own knowledge
+                return await _execute_search(args)
+            return f"Error: Unknown function {name}"
+        return await _EXECUTORS[name](args)
+
+
+class ToolRegistry:
+    """
+    Process-wide tools, built once at startup instead of per request.
+
+    Holds one ToolSet per field group, so prompts reuse the same schema lists
+    on every LLM call.
+    """
+
+    def __init__(self):
+        self.has_search = bool(Config.SERPER_API_KEY)
+        base = ("search", "fetch_url") if self.has_search else ("fetch_url",)
+        self._base = ToolSet(base)
+        self._groups = {group: ToolSet(base + extra) for group, extra in GROUP_EXTRA_TOOLS.items()}
+
+    def for_group(self, group: str) -> ToolSet:
+        """Return the tools for a field group (e.g. Spotify only for "music")."""
+        return self._groups.get(group, self._base)
+
+
+_registry: Optional[ToolRegistry] = None
+
+
+def init_tool_registry() -> ToolRegistry:
+    """Create the tool registry (called from the application lifespan)."""
+    global _registry
+    if _registry is None:
+        _registry = ToolRegistry()
+    return _registry
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Return the tool registry, creating it lazily if the lifespan hasn't run."""
+    return _registry or init_tool_registry()
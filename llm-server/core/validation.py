@@ -49,7 +49,7 @@ def validate_event_data(date: str, title: str, venue: str, url: str = "") -> Dic
 
 def validate_mode(mode: str) -> str:
     """Validate research mode."""
-    valid_modes = ["quick", "artists_list", "artists_fields"]
+    valid_modes = ["quick", "artists_list", "artists_fields", "full"]
     if mode not in valid_modes:
         raise HTTPException(
             status_code=400,
@@ -1,14 +1,49 @@
 """FastAPI application for LLM task server."""
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Query, Request
 from core.config import Config
 from core.rate_limiting import setup_rate_limiting
 from core.cors import setup_cors
-from core.logging import init_agentops
+from core.logging import init_agentops, close_log_sinks
+from core.openai_client import init_openai_client, close_openai_client
+from core.executor import get_tool_executor, shutdown_tool_executor
+from core.tools import init_tool_registry, close_tool_sessions
+from core.cache_store import get_cache_backend, close_cache_backend, cache_stats
+from core.singleflight import research_flights
+from core.cache import run_cache_maintenance
+from core.revalidation import revalidation_stats
+from core.scheduler import get_llm_scheduler
+from core.llm_limits import rate_limit_stats
+from core.hedging import get_hedger
+from core.search_cache import search_cache_stats
+from core.security import dns_cache_stats
+from core.spotify import spotify_stats
+from core.page_cache import get_page_cache
 from core.handlers.concert_research import handle_concert_research
 
 Config.ensure_dirs()
 init_agentops()
-app = FastAPI(title="LLM Task Server", version="1.0.0")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own application-scoped resources (shared OpenAI connection pool, tools, tool thread pool, cache store)."""
+    app.state.openai_client = init_openai_client()
+    init_tool_registry()
+    get_tool_executor()
+    get_cache_backend()
+    maintenance_task = asyncio.create_task(run_cache_maintenance())
+    yield
+    maintenance_task.cancel()
+    close_cache_backend()
+    await close_tool_sessions()
+    shutdown_tool_executor()
+    await close_openai_client()
+    close_log_sinks()
+
+
+app = FastAPI(title="LLM Task Server", version="1.0.0", lifespan=lifespan)
 limiter = setup_rate_limiting(app)
 setup_cors(app)
 
@@ -22,6 +57,23 @@ def root():
     }
 
 
+@app.get("/stats")
+def stats():
+    """Runtime counters (cache hit rates, coalesced requests, LLM queue depth and waits)."""
+    return {
+        "cache": cache_stats(),
+        "single_flight": research_flights.stats(),
+        "revalidation": revalidation_stats(),
+        "llm_scheduler": get_llm_scheduler().stats(),
+        "openai_rate_limits": rate_limit_stats(),
+        "hedging": get_hedger().stats(),
+        "search_cache": search_cache_stats(),
+        "page_cache": get_page_cache().stats(),
+        "dns_cache": dns_cache_stats(),
+        "spotify": spotify_stats(),
+    }
+
+
 @app.get("/tasks/concert-research")
 @limiter.limit(Config.CONCERT_RESEARCH_RATE_LIMIT)
 async def concert_research(
@@ -30,7 +82,7 @@ async def concert_research(
     title: str = Query(..., description="Event title/artists"),
     venue: str = Query(..., description="Venue name"),
     url: str = Query("", description="Event URL (optional)"),
-    mode: str = Query("quick", description="Research mode"),
+    mode: str = Query("quick", description="Research mode (quick, artists_list, artists_fields or full)"),
     artist: str = Query("", description="Single artist name (required for 'artist_fields' mode)"),
     artists: str = Query("", description="JSON array of artist names (required for 'artists_fields' mode)"),
     no_cache: bool = Query(False, description="Skip cache and force fresh data")
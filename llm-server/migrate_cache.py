@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Import legacy one-JSON-file-per-key cache entries into the SQLite cache.
+
+Usage:
+  python migrate_cache.py                              # tasks/logs/cache -> tasks/logs/cache.sqlite3
+  python migrate_cache.py --source DIR --target FILE   # Custom locations
+"""
+import argparse
+from pathlib import Path
+
+from core.config import Config
+from core.cache_store import JsonFileCacheBackend, SqliteCacheBackend, migrate_json_cache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate JSON cache files into the SQLite cache")
+    parser.add_argument("--source", type=Path, default=Config.CACHE_DIR, help="Directory of legacy JSON cache files")
+    parser.add_argument("--target", type=Path, default=Config.CACHE_DB_PATH, help="SQLite database file")
+    args = parser.parse_args()
+
+    source = JsonFileCacheBackend(args.source)
+    target = SqliteCacheBackend(args.target)
+    try:
+        count = migrate_json_cache(source, target)
+    finally:
+        target.close()
+
+    print(f"✓ Imported {count} cache entries from {args.source} into {args.target}")
@@ -4,17 +4,30 @@ import asyncio
 import uuid
 from datetime import datetime
 from typing import AsyncGenerator, Dict, List, Any
+from openai import AsyncOpenAI
 
 from core.config import Config
-from core.cache import build_cache_key, load_cache, save_cache
+from core.cache import (
+    build_cache_key,
+    build_artist_cache_key,
+    load_cache_many,
+    save_cache,
+    cache_ttl,
+    is_cache_stale,
+)
+from core.revalidation import revalidate_in_background
 from core.prompts import (
     build_youtube_prompt,
     build_bio_genres_prompt,
     build_website_prompt,
     build_music_link_prompt,
 )
-from core.tools import build_tools, has_search_tool
+from core.tools import ToolRegistry, get_tool_registry
+from core.research_context import ArtistResearchContext
+from core.spotify import find_unambiguous_artist_url
 from core.llm import run_json_prompt, SerperCreditsExhausted
+from core.llm_limits import LLMRateLimited
+from core.openai_client import get_openai_client
 from core.logging import start_trace, end_trace, create_datapoint_logger
 
 
@@ -24,57 +37,55 @@ def verbose_print(*args, **kwargs):
         print(*args, **kwargs)
 
 
-async def _research_single_field(
-    artist: str,
-    field: str,
-    tools: List,
-    has_search: bool,
-    field_timeout: int,
-    event_data: Dict[str, str] = None
-) -> Dict[str, Any]:
-    """Research a single field for an artist and return display-ready data (with markdown)."""
-    prompt_map = {
-        "youtube": lambda a: build_youtube_prompt(a),
-        "bio": lambda a: build_bio_genres_prompt(a),
-        "genres": lambda a: build_bio_genres_prompt(a),
-        "website": lambda a: build_website_prompt(a, event_data),
-        "music": lambda a: build_music_link_prompt(a, event_data),
+def _datapoint_event(artist: str, field: str, value: Dict[str, Any]) -> Dict[str, str]:
+    """Build the SSE event for a single artist field value."""
+    return {
+        "event": "data",
+        "data": json.dumps({
+            "type": "artist_datapoint",
+            "artist": artist,
+            "field": field,
+            "value": value
+        })
     }
-    
-    if field not in prompt_map:
-        return {"error": f"Unknown field: {field}"}
-    
-    # Filter tools: only include Spotify tool for "music" field
-    field_tools = [t for t in tools if field == "music" or t.name != "spotify_search_artist"]
-    
-    try:
-        # Create descriptive query name for logging
-        field_display_names = {
-            "youtube": "YouTube URL",
-            "bio": "Bio",
-            "genres": "Genres",
-            "website": "Website",
-            "music": "Music Link"
-        }
-        query_desc = f"{field_display_names.get(field, field)} for {artist}"
-        
-        res = await asyncio.wait_for(
-            run_json_prompt(prompt_map[field](artist), field_tools, has_search, query_desc),
-            timeout=field_timeout
-        )
-        res = res or {}
-    except asyncio.TimeoutError:
-        verbose_print(f"[_research_single_field] Timeout after {field_timeout}s for {artist} - {field}")
-        raise  # Re-raise to be handled by caller with context
-    except SerperCreditsExhausted:
-        # Re-raise to be caught by the handler
-        raise
-    except Exception as e:
-        msg = str(e) or e.__class__.__name__
-        verbose_print(f"[_research_single_field] Error for {artist} - {field}: {e}")
-        return {"error": msg}
-    
-    # Normalize into a markdown-friendly shape
+
+
+# Field groups: each group is one LLM computation whose result feeds several output fields.
+# Every field is still streamed (and cached) as its own datapoint.
+FIELD_GROUPS = {
+    "youtube": ["youtube"],
+    "bio_genres": ["bio", "genres"],
+    "website": ["website"],
+    "music": ["music"],
+}
+
+# Keys whose values are the whole useful answer of a group (the other keys are only
+# fallbacks); the field is emitted as soon as they are complete
+FIELD_GROUP_EARLY_KEYS = {
+    "youtube": ("youtube_url",),
+    "website": ("label", "url"),
+    "music": ("platform", "url"),
+}
+
+# Descriptive names for logging
+FIELD_GROUP_DISPLAY_NAMES = {
+    "youtube": "YouTube URL",
+    "bio_genres": "Bio & Genres",
+    "website": "Website",
+    "music": "Music Link",
+}
+
+
+def _group_for_field(field: str) -> str:
+    """Return the field group that computes a given field."""
+    for group, fields in FIELD_GROUPS.items():
+        if field in fields:
+            return group
+    raise KeyError(field)
+
+
+def _normalize_field(field: str, res: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a raw prompt result into display-ready data (with markdown) for one field."""
     if field == "youtube":
         url = res.get("youtube_url") or res.get("url") or res.get("fallback_search_url")
         if url:
@@ -107,17 +118,115 @@ async def _research_single_field(
     return {"error": "Unhandled field"}
 
 
+def _field_status(value: Dict[str, Any]) -> str:
+    """Classify a field value for caching: ok, not_found (a definite answer) or error (retried soon)."""
+    if not isinstance(value, dict) or "error" not in value:
+        return "ok"
+    return "not_found" if value["error"] == "not_found" else "error"
+
+
+def _migrate_legacy_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Split the old combined bio_genres value of a legacy per-artist entry into bio and genres."""
+    if "bio_genres" in fields:
+        bio_genres_value = fields.pop("bio_genres")
+        if isinstance(bio_genres_value, dict):
+            if "bio" in bio_genres_value:
+                fields["bio"] = {"bio": bio_genres_value["bio"], "markdown": bio_genres_value.get("bio", "(not found)")}
+            if "genres" in bio_genres_value:
+                genres_list = bio_genres_value.get("genres", [])
+                genres_str = ", ".join(genres_list) if genres_list else "(not found)"
+                fields["genres"] = {"genres": genres_list, "markdown": genres_str}
+    return fields
+
+
+async def _research_field_group(
+    artist: str,
+    group: str,
+    fields: List[str],
+    registry: ToolRegistry,
+    field_timeout: int,
+    event_data: Dict[str, str] = None,
+    client: AsyncOpenAI = None,
+    rank: int = 0,
+    context: ArtistResearchContext = None
+) -> Dict[str, Dict[str, Any]]:
+    """Research one field group for an artist and return display-ready data for each requested field."""
+    prompt_map = {
+        "youtube": lambda a, ctx: build_youtube_prompt(a, ctx),
+        "bio_genres": lambda a, ctx: build_bio_genres_prompt(a, ctx),
+        "website": lambda a, ctx: build_website_prompt(a, event_data, ctx),
+        "music": lambda a, ctx: build_music_link_prompt(a, event_data, ctx),
+    }
+    
+    if group not in prompt_map:
+        return {field: {"error": f"Unknown field: {field}"} for field in fields}
+    
+    # Deterministic path: an unambiguous exact Spotify match needs no LLM
+    if group == "music" and Config.SPOTIFY_FAST_PATH:
+        spotify_url = await find_unambiguous_artist_url(artist)
+        if spotify_url:
+            verbose_print(f"[_research_field_group] Exact Spotify match for {artist}: {spotify_url}")
+            return {field: _normalize_field(field, {"platform": "Spotify", "url": spotify_url}) for field in fields}
+    
+    # Per-group tool subset (only "music" gets the Spotify tool)
+    field_tools = registry.for_group(group)
+    
+    try:
+        query_desc = f"{FIELD_GROUP_DISPLAY_NAMES.get(group, group)} for {artist}"
+        
+        async def _research():
+            # Shared search results for the artist (searched once for all of its groups)
+            search_context = await context.get(artist) if context else None
+            return await run_json_prompt(
+                prompt_map[group](artist, search_context), field_tools, query_desc,
+                client=client, rank=rank, hedge_key=group, early_keys=FIELD_GROUP_EARLY_KEYS.get(group)
+            )
+        
+        res = await asyncio.wait_for(_research(), timeout=field_timeout)
+        res = res or {}
+    except asyncio.TimeoutError:
+        verbose_print(f"[_research_field_group] Timeout after {field_timeout}s for {artist} - {group}")
+        raise  # Re-raise to be handled by caller with context
+    except SerperCreditsExhausted:
+        # Re-raise to be caught by the handler
+        raise
+    except LLMRateLimited as e:
+        # Transient: flagged so the result is never cached
+        verbose_print(f"[_research_field_group] Rate limited for {artist} - {group}: {e}")
+        return {field: {"error": "rate_limited", "throttled": True} for field in fields}
+    except Exception as e:
+        msg = str(e) or e.__class__.__name__
+        verbose_print(f"[_research_field_group] Error for {artist} - {group}: {e}")
+        return {field: {"error": msg} for field in fields}
+    
+    # Normalize into a markdown-friendly shape, one value per output field
+    return {field: _normalize_field(field, res) for field in fields}
+
+
 async def artists_fields_handler(
     event_data: Dict[str, str],
-    artists: List[str]
+    artists: List[str],
+    client: AsyncOpenAI = None,
+    fields: List[str] = None,
+    rank_offset: int = 0
 ) -> AsyncGenerator[Dict[str, str], None]:
     """
     Research field details for a list of artists.
     
     Architecture:
-    - All artist+field combinations are requested in parallel
+    - All artist+field group combinations are requested in parallel
+      (bio and genres share one LLM call, see FIELD_GROUPS)
     - Each field result is streamed to client as it completes
-    - Results are cached per artist (with all fields)
+    - Each field is cached on its own as soon as it arrives, per event and (if
+      successful) per artist name so other events with the same artist can reuse it.
+      Errors are cached for CACHE_FIELD_ERROR_TTL only, then researched again.
+    
+    Args:
+        event_data: Event info (date, venue, title, no_cache...)
+        artists: Artist names
+        client: Shared AsyncOpenAI client
+        fields: Restrict research to these fields (defaults to all fields)
+        rank_offset: Scheduler rank of the first artist (when researching a lineup piecemeal)
     
     Events:
     - {"event": "data", "data": "..."} where data is JSON with:
@@ -125,12 +234,12 @@ async def artists_fields_handler(
     - {"event": "data", "data": "..."} where data is JSON with:
       - {"type": "complete"}
     """
-    tools = build_tools()
-    has_search = has_search_tool(tools)
+    client = client or get_openai_client()
+    registry = get_tool_registry()
     field_timeout = Config.ARTIST_DATAPOINT_TIMEOUT
     
     # Expected fields for each artist
-    expected_fields = ["youtube", "bio", "genres", "website", "music"]
+    expected_fields = list(fields or ["youtube", "bio", "genres", "website", "music"])
     # Parse no_cache - handle both bool and string "true"/"false"
     no_cache_raw = event_data.get("no_cache", False)
     if isinstance(no_cache_raw, str):
@@ -140,53 +249,92 @@ async def artists_fields_handler(
     
     verbose_print(f"[artists_fields_handler] no_cache={no_cache}, type={type(no_cache)}, raw={no_cache_raw}")
     
+    fields_ttl = cache_ttl("artist_fields")
+    event_date = event_data.get("date")
+    
+    def _field_key(artist: str, field: str) -> str:
+        return build_cache_key(event_data, f"artist_field_{artist}_{field}")
+    
+    def _legacy_key(artist: str) -> str:
+        return build_cache_key(event_data, f"artist_fields_{artist}")
+    
     # Check cache for each artist
     artist_cache_map: Dict[str, Dict[str, Any]] = {}
     artists_to_research: List[str] = []
+    fields_to_research: Dict[str, List[str]] = {}
+    
+    # Batched lookups for every artist and field at once. Per event: one entry per
+    # field (plus the legacy all-fields entry); per artist: one entry per field
+    # (plus the legacy entry with every successful field).
+    event_cached: Dict[str, Dict[str, Any]] = {}
+    artist_tier_cached: Dict[str, Dict[str, Any]] = {}
+    if not no_cache:
+        event_keys = [_field_key(a, f) for a in artists for f in expected_fields]
+        event_keys += [_legacy_key(a) for a in artists]
+        artist_keys = [build_artist_cache_key(a, f) for a in artists for f in expected_fields]
+        artist_keys += [build_artist_cache_key(a) for a in artists]
+        event_cached = load_cache_many(event_keys, max_age=fields_ttl + Config.CACHE_STALE_TTL)
+        artist_tier_cached = load_cache_many(artist_keys, max_age=Config.ARTIST_CACHE_TTL + Config.CACHE_STALE_TTL)
+    
+    def _cached_field(artist: str, field: str):
+        """Find a servable cached value for one field. Returns (value, entry, ttl) or None."""
+        event_entry = event_cached.get(_field_key(artist, field))
+        artist_entry = artist_tier_cached.get(build_artist_cache_key(artist, field))
+        if event_entry and "value" in event_entry:
+            if event_entry.get("status") != "error":
+                return event_entry["value"], event_entry, fields_ttl
+            # A negative-cached failure for this event loses to a good value found since by another event
+            if not (artist_entry and "value" in artist_entry and artist_entry.get("status") == "ok"):
+                return event_entry["value"], event_entry, Config.CACHE_FIELD_ERROR_TTL
+        if artist_entry and "value" in artist_entry:
+            return artist_entry["value"], artist_entry, Config.ARTIST_CACHE_TTL
+        # Legacy per-artist entries; errors stored in them are not trusted (they never expired)
+        for entry, ttl in (
+            (event_cached.get(_legacy_key(artist)), fields_ttl),
+            (artist_tier_cached.get(build_artist_cache_key(artist)), Config.ARTIST_CACHE_TTL),
+        ):
+            if entry and isinstance(entry.get("fields"), dict):
+                value = _migrate_legacy_fields(entry["fields"]).get(field)
+                if value is not None and _field_status(value) != "error":
+                    return value, entry, ttl
+        return None
     
     for artist in artists:
+        artist_cache_map[artist] = {}
+        missing_fields = list(expected_fields)
         if not no_cache:
             try:
-                cache_key = build_cache_key(event_data, f"artist_fields_{artist}")
-                cached = load_cache(cache_key)
-                if cached and "fields" in cached:
-                    fields = cached["fields"]
-                    
-                    # Migrate old bio_genres field to separate bio and genres fields
-                    if "bio_genres" in fields:
-                        bio_genres_value = fields["bio_genres"]
-                        if isinstance(bio_genres_value, dict):
-                            # Extract bio and genres from the old structure
-                            if "bio" in bio_genres_value:
-                                fields["bio"] = {"bio": bio_genres_value["bio"], "markdown": bio_genres_value.get("bio", "(not found)")}
-                            if "genres" in bio_genres_value:
-                                genres_list = bio_genres_value.get("genres", [])
-                                genres_str = ", ".join(genres_list) if genres_list else "(not found)"
-                                fields["genres"] = {"genres": genres_list, "markdown": genres_str}
-                        # Remove the old field
-                        del fields["bio_genres"]
-                    
-                    artist_cache_map[artist] = fields
-                    # Stream cached fields immediately (only new field names)
-                    for field in expected_fields:
-                        if field in fields:
-                            yield {
-                                "event": "data",
-                                "data": json.dumps({
-                                    "type": "artist_datapoint",
-                                    "artist": artist,
-                                    "field": field,
-                                    "value": fields[field]
-                                })
-                            }
-                    continue  # Skip to next artist if cached
+                stale_fields = []
+                for field in expected_fields:
+                    hit = _cached_field(artist, field)
+                    if hit is None:
+                        continue
+                    value, entry, ttl = hit
+                    artist_cache_map[artist][field] = value
+                    # Stream cached fields immediately
+                    yield _datapoint_event(artist, field, value)
+                    if is_cache_stale(entry, ttl):
+                        stale_fields.append(field)
+                missing_fields = [f for f in expected_fields if f not in artist_cache_map[artist]]
+                if stale_fields:
+                    # Serve-stale-then-refresh: re-research only the stale fields in the background
+                    revalidate_in_background(
+                        f"{_legacy_key(artist)}:{','.join(stale_fields)}",
+                        lambda artist=artist, stale_fields=stale_fields: artists_fields_handler(
+                            {**event_data, "no_cache": True}, [artist], client, stale_fields
+                        )
+                    )
+                if artist_cache_map[artist]:
+                    verbose_print(f"[cache] {artist}: cached {sorted(artist_cache_map[artist])}, missing {missing_fields}")
             except Exception as e:
                 verbose_print(f"[artists_fields_handler] Error loading cache for {artist}: {e}")
                 # Continue to research this artist
+                missing_fields = [f for f in expected_fields if f not in artist_cache_map[artist]]
         
-        # Artist not cached or no_cache is True
-        artists_to_research.append(artist)
-        artist_cache_map[artist] = {}
+        # Only research the fields the cache couldn't serve (all of them if no_cache is True)
+        if missing_fields:
+            artists_to_research.append(artist)
+            fields_to_research[artist] = missing_fields
     
     # If all artists are cached, we're done
     if not artists_to_research:
@@ -194,113 +342,87 @@ async def artists_fields_handler(
         return
     
     trace_obj = start_trace([f"concert-artists-fields", event_data.get('title', 'unknown')[:50]])
+    all_tasks = []
+    search_context = ArtistResearchContext(registry.has_search)
     
     try:
         ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
         run_id = str(uuid.uuid4())[:8]
         log_dp = create_datapoint_logger(ts, run_id)
         
-        # Create all field research tasks in parallel
-        # This creates N artists × M fields = total parallel requests
-        # Wrap each task to preserve artist/field information
-        async def _research_with_metadata(artist: str, field: str):
-            """Wrapper to preserve artist/field metadata with the result."""
+        # Create all field group research tasks in parallel
+        # This creates N artists × M field groups = total parallel requests
+        async def _research_with_metadata(artist: str, group: str, fields: List[str]):
+            """
+            Research one group and return (artist, group, values). Failures become error
+            values here: as_completed yields new awaitables, not these tasks, so the loop
+            below can't tell which artist/group a raised exception belonged to.
+            """
             try:
-                result = await _research_single_field(artist, field, tools, has_search, field_timeout, event_data)
-                return (artist, field, result)
+                # Earlier artists in the lineup get scheduled first
+                rank = rank_offset + artists.index(artist)
+                groups = [g for g, fs in FIELD_GROUPS.items() if any(f in fields_to_research[artist] for f in fs)]
+                context = search_context if len(groups) >= Config.ARTIST_CONTEXT_MIN_GROUPS else None
+                values = await _research_field_group(
+                    artist, group, fields, registry, field_timeout, event_data, client, rank, context
+                )
+            except SerperCreditsExhausted:
+                # Re-raise to be caught by outer handler
+                raise
             except asyncio.TimeoutError:
-                # Re-raise with context
-                raise asyncio.TimeoutError(f"Timeout after {field_timeout}s for {artist} - {field}")
+                verbose_print(f"[artists_fields_handler] TimeoutError after {field_timeout}s for {artist} - {group}")
+                values = {field: {"error": "TimeoutError"} for field in fields}
             except Exception as e:
-                # Wrap exception to preserve artist/field context
-                raise type(e)(f"{artist} - {field}: {str(e)}") from e
+                msg = f"{str(e) or e.__class__.__name__} (for {artist} - {group})"
+                verbose_print(f"[artists_fields_handler] Error for {artist} - {group}: {e}")
+                values = {field: {"error": msg} for field in fields}
+            return artist, group, values
         
-        # Store task metadata for error handling
-        task_metadata = {}
-        all_tasks = []
         for artist in artists_to_research:
-            for field in expected_fields:
-                task = asyncio.create_task(
-                    _research_with_metadata(artist, field)
-                )
-                task_metadata[task] = (artist, field)
-                all_tasks.append(task)
+            for group, group_fields in FIELD_GROUPS.items():
+                fields = [f for f in group_fields if f in fields_to_research[artist]]
+                if not fields:
+                    continue
+                all_tasks.append(asyncio.create_task(
+                    _research_with_metadata(artist, group, fields)
+                ))
         
-        print(f"  → Starting {len(all_tasks)} parallel field queries ({len(artists_to_research)} artists × {len(expected_fields)} fields)")
+        print(f"  → Starting {len(all_tasks)} parallel field queries ({len(artists_to_research)} artists × up to {len(FIELD_GROUPS)} field groups)")
         
         # Stream results as they complete
         # asyncio.as_completed returns an iterator of futures, use regular for loop
-        for completed_task in asyncio.as_completed(all_tasks):
-            artist, field = task_metadata.get(completed_task, ("unknown", "unknown"))
-            try:
-                artist, field, value = await completed_task
+        for completed in asyncio.as_completed(all_tasks):
+            artist, group, values = await completed
+            
+            # Stream each field of the group as its own datapoint
+            for field, value in values.items():
                 artist_cache_map[artist][field] = value
-                
-                # Stream the datapoint immediately
-                yield {
-                    "event": "data",
-                    "data": json.dumps({
-                        "type": "artist_datapoint",
-                        "artist": artist,
-                        "field": field,
-                        "value": value
-                    })
-                }
-                
+                yield _datapoint_event(artist, field, value)
                 log_dp({"type": "datapoint", "artist": artist, "field": field, "value": value})
-                
-                # Always cache when all fields for an artist are complete (even if no_cache was True)
-                # The no_cache flag only controls reading from cache, not writing to it
-                if all(f in artist_cache_map[artist] for f in expected_fields):
-                    try:
-                        cache_key = build_cache_key(event_data, f"artist_fields_{artist}")
-                        save_cache(cache_key, {
-                            "artist": artist,
-                            "fields": artist_cache_map[artist]
-                        })
-                        if no_cache:
-                            verbose_print(f"[artists_fields_handler] Saved fresh data to cache for {artist} (refetch)")
-                    except Exception as e:
-                        verbose_print(f"[artists_fields_handler] Error saving cache for {artist}: {e}")
-                        # Non-fatal error, continue
-                    log_dp({"type": "artist_complete", "artist": artist})
+                # Persist every field as soon as it arrives (even if no_cache was True - the
+                # flag only controls reading). Rate-limited fields are simply retried next time.
+                if isinstance(value, dict) and value.get("throttled"):
+                    continue
+                status = _field_status(value)
+                try:
+                    entry = {"artist": artist, "field": field, "status": status, "value": value}
+                    if status == "error":
+                        # Negative cache: no stale window, retried once the short TTL is over
+                        save_cache(_field_key(artist, field), entry,
+                                   ttl=Config.CACHE_FIELD_ERROR_TTL, event_date=event_date, stale_ttl=0)
+                    else:
+                        save_cache(_field_key(artist, field), entry, ttl=fields_ttl, event_date=event_date)
+                    if status == "ok":
+                        # Share successful fields with other events for this artist
+                        save_cache(build_artist_cache_key(artist, field), entry, ttl=Config.ARTIST_CACHE_TTL)
+                except Exception as e:
+                    verbose_print(f"[artists_fields_handler] Error saving cache for {artist} - {field}: {e}")
+                    # Non-fatal error, continue
             
-            except SerperCreditsExhausted:
-                # Re-raise to be caught by outer handler
-                raise
-            except asyncio.TimeoutError as e:
-                # Handle timeout specifically
-                error_msg = f"Timeout after {field_timeout}s"
-                verbose_print(f"[artists_fields_handler] TimeoutError for {artist} - {field}: {e}")
-                error_value = {"error": "TimeoutError"}
-                artist_cache_map[artist][field] = error_value
-                yield {
-                    "event": "data",
-                    "data": json.dumps({
-                        "type": "artist_datapoint",
-                        "artist": artist,
-                        "field": field,
-                        "value": error_value
-                    })
-                }
-            except Exception as e:
-                # Extract error message, handling wrapped exceptions
-                msg = str(e) or e.__class__.__name__
-                # If the error message already contains artist/field, use it; otherwise add context
-                if f"{artist} - {field}" not in msg:
-                    msg = f"{msg} (for {artist} - {field})"
-                verbose_print(f"[artists_fields_handler] Error for {artist} - {field}: {e}")
-                error_value = {"error": msg}
-                artist_cache_map[artist][field] = error_value
-                yield {
-                    "event": "data",
-                    "data": json.dumps({
-                        "type": "artist_datapoint",
-                        "artist": artist,
-                        "field": field,
-                        "value": error_value
-                    })
-                }
+            if all(f in artist_cache_map[artist] for f in expected_fields):
+                if no_cache:
+                    verbose_print(f"[artists_fields_handler] Saved fresh data to cache for {artist} (refetch)")
+                log_dp({"type": "artist_complete", "artist": artist})
         
         yield {"event": "data", "data": json.dumps({"type": "complete"})}
         log_dp({"type": "complete", "artists": artists})
@@ -318,3 +440,10 @@ async def artists_fields_handler(
             error_msg = "A timeout or processing error occurred. Please try again."
         yield {"event": "error", "data": f"Error: {error_msg}"}
         end_trace(trace_obj, "Fail")
+    finally:
+        # Never leave research running unobserved (cancelled request, fatal error):
+        # its results would be neither streamed nor cached
+        for task in all_tasks:
+            if not task.done():
+                task.cancel()
+        search_context.close()
@@ -1,10 +1,16 @@
 """Artists list extraction handler."""
 import json
-from typing import AsyncGenerator, Dict
+from typing import AsyncGenerator, Dict, Optional
+from openai import AsyncOpenAI
 
 from core.config import Config
-from core.cache import build_cache_key, load_cache, save_cache
+from core.cache import build_cache_key, load_cache, save_cache, cache_ttl, is_cache_stale
+from core.revalidation import revalidate_in_background
 from core.prompts import build_extract_artists_prompt
+from core.lineup import extract_artists_from_title
+from core.openai_client import get_openai_client
+from core.llm import create_chat_completion
+from core.scheduler import PRIORITY_ARTISTS_LIST
 from core.logging import start_trace, end_trace
 
 
@@ -14,10 +20,35 @@ def verbose_print(*args, **kwargs):
         print(*args, **kwargs)
 
 
-async def artists_list_handler(event_data: Dict[str, str]) -> AsyncGenerator[Dict[str, str], None]:
+UNABLE_TO_DETERMINE = "Unable to determine artists"
+
+
+def _is_list_source(event_data: Dict[str, str]) -> bool:
+    """Titles scraped from The List (foopee) are plain comma-separated lineups."""
+    url = event_data.get("url", "").lower()
+    return "foopee.com" in url or "thelistsf.com" in url or "(via the list)" in event_data.get("venue", "").lower()
+
+
+def _parse_artist_line(line: str) -> Optional[str]:
+    """Return the artist name on one line of the model's answer, or None."""
+    name = line.strip()
+    if not name or name == UNABLE_TO_DETERMINE:
+        return None
+    return name
+
+
+async def stream_artists(
+    event_data: Dict[str, str],
+    client: AsyncOpenAI = None
+) -> AsyncGenerator[str, None]:
     """
-    Extract artist list from event data.
-    Streams: {"event": "data", "data": "..."} where data is JSON array of artist names
+    Yield the event's artist names, each as soon as it is known.
+
+    A cached list is replayed (and refreshed in the background when stale).
+    Titles that are plain lineups are split without an LLM call. Otherwise the
+    extraction completion is streamed and every line is yielded
+    as soon as it is complete (duplicates skipped); the full list is cached at the end.
+    Yields nothing if the model can't determine the artists. LLM errors propagate.
     """
     # Parse no_cache - handle both bool and string "true"/"false"
     no_cache_raw = event_data.get("no_cache", False)
@@ -25,9 +56,9 @@ async def artists_list_handler(event_data: Dict[str, str]) -> AsyncGenerator[Dic
         no_cache = no_cache_raw.lower() in ("true", "1", "yes")
     else:
         no_cache = bool(no_cache_raw)
-    
+
     verbose_print(f"[artists_list_handler] no_cache={no_cache}, type={type(no_cache)}, raw={no_cache_raw}")
-    
+
     # Build cache key - we need it for both reading and writing
     cache_key = None
     try:
@@ -35,49 +66,110 @@ async def artists_list_handler(event_data: Dict[str, str]) -> AsyncGenerator[Dic
     except Exception as e:
         verbose_print(f"[artists_list_handler] Error building cache key: {e}")
         cache_key = None  # Continue without cache
-    
+
     # Check cache only if not skipping and we have a valid key
+    cached = None
     if not no_cache and cache_key is not None:
         try:
-            cached = load_cache(cache_key)
+            ttl = cache_ttl("artists_list")
+            cached = load_cache(cache_key, max_age=ttl + Config.CACHE_STALE_TTL)
             if cached and "artists" in cached:
                 verbose_print(f"[cache] artists_list hit for key={cache_key}")
-                yield {"event": "data", "data": json.dumps(cached["artists"])}
-                return
+                if is_cache_stale(cached, ttl):
+                    # Serve stale immediately, refresh in the background
+                    revalidate_in_background(cache_key, lambda: artists_list_handler({**event_data, "no_cache": True}, client))
+            else:
+                cached = None
         except Exception as e:
             verbose_print(f"[artists_list_handler] Error loading cache: {e}")
-            # Continue to fetch fresh data
+            cached = None  # Continue to fetch fresh data
+    if cached:
+        for artist in cached["artists"]:
+            yield artist
+        return
 
+    def _save(artists):
+        # Always save to cache after fetching fresh data (even if no_cache was True)
+        # The no_cache flag only controls reading from cache, not writing to it
+        if not artists or cache_key is None:
+            return
+        try:
+            save_cache(cache_key, {"artists": artists}, ttl=cache_ttl("artists_list"), event_date=event_data.get("date"))
+            if no_cache:
+                verbose_print(f"[artists_list_handler] Saved fresh data to cache (refetch)")
+        except Exception as e:
+            verbose_print(f"[artists_list_handler] Error saving cache: {e}")
+            # Non-fatal error, continue
+
+    # Plain lineups ("A, B w/ C") are split deterministically; the LLM only handles the rest
+    if Config.TITLE_PARSER_ENABLED:
+        artists, confidence = extract_artists_from_title(event_data.get("title", ""), _is_list_source(event_data))
+        if artists and confidence >= Config.TITLE_PARSER_MIN_CONFIDENCE:
+            print(f"  → Parsed {len(artists)} artist(s) from title (confidence {confidence:.2f}), skipping LLM")
+            for artist in artists:
+                yield artist
+            _save(artists)
+            return
+        verbose_print(f"[artists_list_handler] Title parser confidence {confidence:.2f} too low, using LLM")
+
+    # Use OpenAI SDK directly to avoid LangChain parse issues
+    client = client or get_openai_client()
+    extract_prompt = build_extract_artists_prompt(event_data)
+
+    # Log query start (non-verbose)
+    print(f"  → Querying LLM: Extract artists from '{event_data.get('title', 'event')[:50]}'")
+
+    stream = await create_chat_completion(
+        client, PRIORITY_ARTISTS_LIST,
+        model=Config.DETAILED_MODEL,
+        messages=[{"role": "user", "content": extract_prompt}],
+        max_tokens=Config.DETAILED_MAX_TOKENS,
+        temperature=Config.TEMPERATURE,
+        stream=True,
+    )
+
+    # Parse artist list (one artist per line) as the lines arrive
+    artists = []
+    pending = ""
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if not delta or not delta.content:
+                continue
+            pending += delta.content
+            while "\n" in pending:
+                line, pending = pending.split("\n", 1)
+                artist = _parse_artist_line(line)
+                if artist and artist not in artists:
+                    artists.append(artist)
+                    yield artist
+    finally:
+        # Close the HTTP response promptly if we're cancelled mid-stream
+        await stream.close()
+    artist = _parse_artist_line(pending)
+    if artist and artist not in artists:
+        artists.append(artist)
+        yield artist
+
+    _save(artists)
+
+
+async def artists_list_handler(
+    event_data: Dict[str, str],
+    client: AsyncOpenAI = None
+) -> AsyncGenerator[Dict[str, str], None]:
+    """
+    Extract artist list from event data.
+    Streams: {"event": "data", "data": "..."} where data is JSON array of artist names
+    """
     trace_obj = start_trace(["concert-artists-list", event_data.get('title', 'unknown')[:50]])
 
     try:
-        # Use OpenAI SDK directly to avoid LangChain parse issues
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
-        extract_prompt = build_extract_artists_prompt(event_data)
-        
-        # Log query start (non-verbose)
-        print(f"  → Querying LLM: Extract artists from '{event_data.get('title', 'event')[:50]}'")
-
-        completion = await client.chat.completions.create(
-            model=Config.DETAILED_MODEL,
-            messages=[{"role": "user", "content": extract_prompt}],
-            max_tokens=Config.DETAILED_MAX_TOKENS,
-            temperature=Config.TEMPERATURE,
-            stream=False,
-        )
-
-        artist_list_text = completion.choices[0].message.content or ""
-
-        # Parse artist list (one artist per line)
-        artists = [
-            line.strip()
-            for line in artist_list_text.strip().split('\n')
-            if line.strip() and line.strip() != "Unable to determine artists"
-        ]
-
-        if not artists or artist_list_text.strip() == "Unable to determine artists":
+        artists = [artist async for artist in stream_artists(event_data, client)]
+
+        if not artists:
             yield {"event": "error", "data": "Unable to determine artists for this event."}
             end_trace(trace_obj, "Success")
             return
@@ -85,17 +177,6 @@ async def artists_list_handler(event_data: Dict[str, str]) -> AsyncGenerator[Dic
         # Stream the artist list (JSON-serialized for SSE)
         yield {"event": "data", "data": json.dumps(artists)}
 
-        # Always save to cache after fetching fresh data (even if no_cache was True)
-        # The no_cache flag only controls reading from cache, not writing to it
-        if cache_key is not None:
-            try:
-                save_cache(cache_key, {"artists": artists})
-                if no_cache:
-                    verbose_print(f"[artists_list_handler] Saved fresh data to cache (refetch)")
-            except Exception as e:
-                verbose_print(f"[artists_list_handler] Error saving cache: {e}")
-                # Non-fatal error, continue
-
         end_trace(trace_obj, "Success")
 
     except Exception as e:
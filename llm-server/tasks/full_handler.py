@@ -0,0 +1,121 @@
+"""Full research handler - quick summary, artist list and artist fields in one stream."""
+import json
+import asyncio
+from typing import Any, AsyncGenerator, Coroutine, Dict, List
+from openai import AsyncOpenAI
+
+from core.config import Config
+from core.openai_client import get_openai_client
+from core.logging import start_trace, end_trace
+from tasks.quick_handler import quick_research_handler
+from tasks.artists_list_handler import stream_artists
+from tasks.artists_fields_handler import artists_fields_handler
+
+
+def verbose_print(*args, **kwargs):
+    """Print only if verbose mode is enabled."""
+    if Config.VERBOSE:
+        print(*args, **kwargs)
+
+
+# Queue marker: one stage task has finished
+_STAGE_DONE = object()
+
+
+def _typed_event(payload: Dict[str, Any]) -> Dict[str, str]:
+    """Build an SSE data event carrying a typed JSON payload."""
+    return {"event": "data", "data": json.dumps(payload)}
+
+
+def _stage_error(stage: str, message: str) -> Dict[str, str]:
+    """
+    Build the event for a failed stage. Sent as data (not an SSE error event) so
+    the other stages keep streaming on the same connection.
+    """
+    return _typed_event({"type": "stage_error", "stage": stage, "message": message})
+
+
+async def full_research_handler(
+    event_data: Dict[str, str],
+    client: AsyncOpenAI = None
+) -> AsyncGenerator[Dict[str, str], None]:
+    """
+    Full mode: quick summary, artist extraction and field research in one stream.
+
+    The phases overlap: the quick summary streams alongside artist extraction, and
+    field research for an artist starts as soon as its line of the extraction
+    answer is complete instead of after the whole list.
+
+    Events (all {"event": "data"} with JSON data):
+    - {"type": "quick_chunk", "text": "..."}
+    - {"type": "artist", "artist": "..."} (as each artist is found)
+    - {"type": "artists_list", "artists": [...]} (once extraction is complete)
+    - {"type": "artist_datapoint", "artist": "...", "field": "...", "value": {...}}
+    - {"type": "stage_error", "stage": "quick" | "artists_list" | "artists_fields", "message": "..."}
+    - {"type": "complete"}
+    """
+    client = client or get_openai_client()
+    queue: asyncio.Queue = asyncio.Queue()
+    tasks: List[asyncio.Task] = []
+    running = 0
+
+    async def _guarded(coro: Coroutine, stage: str):
+        """Run a stage, reporting an unexpected exception as a stage error."""
+        try:
+            await coro
+        except Exception as e:
+            verbose_print(f"[full_handler] {stage} failed: {e}")
+            await queue.put(_stage_error(stage, f"Error: {str(e) or e.__class__.__name__}"))
+        finally:
+            await queue.put(_STAGE_DONE)
+
+    def _spawn(coro: Coroutine, stage: str):
+        nonlocal running
+        running += 1
+        tasks.append(asyncio.create_task(_guarded(coro, stage)))
+
+    async def _run_quick():
+        async for item in quick_research_handler(event_data, client):
+            if item.get("event") == "error":
+                await queue.put(_stage_error("quick", item["data"]))
+            else:
+                await queue.put(_typed_event({"type": "quick_chunk", "text": item["data"]}))
+
+    async def _run_fields(artist: str, rank: int):
+        async for item in artists_fields_handler(event_data, [artist], client, rank_offset=rank):
+            if item.get("event") == "error":
+                await queue.put(_stage_error("artists_fields", f"{artist}: {item['data']}"))
+            elif json.loads(item["data"]).get("type") == "artist_datapoint":
+                # The per-artist "complete" events are replaced by one final "complete"
+                await queue.put(item)
+
+    async def _run_artists():
+        artists: List[str] = []
+        async for artist in stream_artists(event_data, client):
+            artists.append(artist)
+            await queue.put(_typed_event({"type": "artist", "artist": artist}))
+            # Start researching this artist right away, in lineup order
+            _spawn(_run_fields(artist, len(artists) - 1), "artists_fields")
+        if artists:
+            await queue.put(_typed_event({"type": "artists_list", "artists": artists}))
+        else:
+            await queue.put(_stage_error("artists_list", "Unable to determine artists for this event."))
+
+    trace_obj = start_trace(["concert-full", event_data.get('title', 'unknown')[:50]])
+    _spawn(_run_quick(), "quick")
+    _spawn(_run_artists(), "artists_list")
+
+    try:
+        # Stages spawn field research while running, so count stages rather than tasks
+        while running:
+            item = await queue.get()
+            if item is _STAGE_DONE:
+                running -= 1
+                continue
+            yield item
+        yield _typed_event({"type": "complete"})
+        end_trace(trace_obj, "Success")
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
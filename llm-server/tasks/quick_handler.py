@@ -1,12 +1,14 @@
 """Quick research handler - fast streaming summary."""
 from typing import AsyncGenerator, Dict
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from openai import AsyncOpenAI
 
 from core.config import Config
-from core.cache import build_cache_key, load_cache, save_cache
+from core.cache import build_cache_key, load_cache, save_cache, cache_ttl, is_cache_stale
+from core.revalidation import revalidate_in_background
 from core.prompts import build_quick_prompt
-from core.llm import create_llm
+from core.openai_client import get_openai_client
+from core.scheduler import PRIORITY_QUICK
+from core.llm import create_chat_completion
 from core.logging import start_trace, end_trace
 
 
@@ -16,7 +18,10 @@ def verbose_print(*args, **kwargs):
         print(*args, **kwargs)
 
 
-async def quick_research_handler(event_data: Dict[str, str]) -> AsyncGenerator[Dict[str, str], None]:
+async def quick_research_handler(
+    event_data: Dict[str, str],
+    client: AsyncOpenAI = None
+) -> AsyncGenerator[Dict[str, str], None]:
     """
     Quick mode: single streaming LLM call, no tools, 2-3 sentence summary.
     Events: {"event": "data", "data": "...streaming text chunk..."}
@@ -41,10 +46,14 @@ async def quick_research_handler(event_data: Dict[str, str]) -> AsyncGenerator[D
     # Check cache only if not skipping and we have a valid key
     if not no_cache and cache_key is not None:
         try:
-            cached = load_cache(cache_key)
+            ttl = cache_ttl("quick")
+            cached = load_cache(cache_key, max_age=ttl + Config.CACHE_STALE_TTL)
             if cached and "quickSummary" in cached:
                 verbose_print(f"[cache] quick hit for key={cache_key}")
                 yield {"event": "data", "data": cached["quickSummary"]}
+                if is_cache_stale(cached, ttl):
+                    # Serve stale immediately, refresh in the background
+                    revalidate_in_background(cache_key, lambda: quick_research_handler({**event_data, "no_cache": True}, client))
                 return
         except Exception as e:
             verbose_print(f"[quick_handler] Error loading cache: {e}")
@@ -58,26 +67,18 @@ async def quick_research_handler(event_data: Dict[str, str]) -> AsyncGenerator[D
     trace_obj = start_trace(["concert-quick", event_data.get('title', 'unknown')[:50]])
 
     try:
-        llm = create_llm(
-            model=Config.QUICK_MODEL,
-            streaming=True,
-            max_tokens=Config.QUICK_MAX_TOKENS,
-            temperature=Config.TEMPERATURE
-        )
-
         quick_prompt = build_quick_prompt(event_data)
         
         # Log query start (non-verbose)
         print(f"  → Querying LLM: Quick summary for '{event_data.get('title', 'event')[:50]}'")
         
         # Use OpenAI SDK directly to avoid LangChain async context manager bug
-        from openai import AsyncOpenAI
-        
-        client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
+        client = client or get_openai_client()
         quick_buffer = ""
         
-        # Stream directly from OpenAI API
-        stream = await client.chat.completions.create(
+        # Stream directly from OpenAI API (the stream holds its scheduler slot until closed)
+        stream = await create_chat_completion(
+            client, PRIORITY_QUICK,
             model=Config.QUICK_MODEL,
             messages=[{"role": "user", "content": quick_prompt}],
             max_tokens=Config.QUICK_MAX_TOKENS,
@@ -85,20 +86,24 @@ async def quick_research_handler(event_data: Dict[str, str]) -> AsyncGenerator[D
             stream=True
         )
         
-        async for chunk in stream:
-            # Check if choices array exists and has at least one element
-            if chunk.choices and len(chunk.choices) > 0:
-                delta = chunk.choices[0].delta
-                if delta and hasattr(delta, 'content') and delta.content:
-                    content = delta.content
-                    quick_buffer += content
-                    yield {"event": "data", "data": content}
+        try:
+            async for chunk in stream:
+                # Check if choices array exists and has at least one element
+                if chunk.choices and len(chunk.choices) > 0:
+                    delta = chunk.choices[0].delta
+                    if delta and hasattr(delta, 'content') and delta.content:
+                        content = delta.content
+                        quick_buffer += content
+                        yield {"event": "data", "data": content}
+        finally:
+            # Close the HTTP response promptly if we're cancelled mid-stream
+            await stream.close()
         
         # Always save to cache after fetching fresh data (even if no_cache was True)
         # The no_cache flag only controls reading from cache, not writing to it
         if cache_key is not None:
             try:
-                save_cache(cache_key, {"quickSummary": quick_buffer})
+                save_cache(cache_key, {"quickSummary": quick_buffer}, ttl=cache_ttl("quick"), event_date=event_data.get("date"))
                 if no_cache:
                     verbose_print(f"[quick_handler] Saved fresh data to cache (refetch)")
             except Exception as e:
@@ -0,0 +1,116 @@
+"""Tests for the artists fields handler (tasks/artists_fields_handler.py)."""
+import sys
+import json
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path so we can import from tasks
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.cache_store as cache_store
+import tasks.artists_fields_handler as handler
+from core.cache import build_cache_key, load_cache
+from core.config import Config
+
+
+EVENT = {"date": "2099-01-01", "venue": "The Chapel", "title": "Radiohead", "url": "https://example.com"}
+
+ANSWERS = {
+    "bio_genres": {"bio": "A band.", "genres": ["rock"]},
+    "website": {"label": "Website", "url": "https://radiohead.com"},
+    "music": {"platform": "Bandcamp", "url": "https://radiohead.bandcamp.com"},
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "LOGS_DIR", tmp_path)
+    monkeypatch.setattr(Config, "SERPER_API_KEY", None)
+    monkeypatch.setattr(Config, "SPOTIFY_FAST_PATH", False)
+    monkeypatch.setattr(Config, "LLM_HEDGE_ENABLED", False)
+    monkeypatch.setattr(Config, "ARTIST_DATAPOINT_TIMEOUT", 0.2)
+    backend = cache_store.MemoryLruCacheBackend(cache_store.SqliteCacheBackend(tmp_path / "cache.sqlite3"), 100, 1 << 20)
+    monkeypatch.setattr(cache_store, "_backend", backend)
+    yield
+    backend.close()
+
+
+def _parse(timestamp: str) -> datetime:
+    return datetime.fromisoformat(timestamp.rstrip("Z"))
+
+
+def _collect(artists):
+    async def run():
+        return [item async for item in handler.artists_fields_handler(EVENT, artists, client=object())]
+    return asyncio.run(run())
+
+
+def test_timed_out_group_is_streamed_and_negatively_cached(monkeypatch):
+    async def fake_run_json_prompt(prompt, tools, query_description=None, hedge_key=None, **kwargs):
+        if hedge_key == "youtube":
+            await asyncio.sleep(1)  # Past ARTIST_DATAPOINT_TIMEOUT
+        return ANSWERS[hedge_key]
+
+    monkeypatch.setattr(handler, "run_json_prompt", fake_run_json_prompt)
+    events = _collect(["Radiohead"])
+
+    assert all(event["event"] == "data" for event in events)
+    payloads = [json.loads(event["data"]) for event in events]
+    assert payloads[-1] == {"type": "complete"}
+    values = {p["field"]: p["value"] for p in payloads if p["type"] == "artist_datapoint"}
+    assert set(values) == {"youtube", "bio", "genres", "website", "music"}
+    assert values["youtube"] == {"error": "TimeoutError"}
+    assert values["website"]["url"] == "https://radiohead.com"
+
+    cached = load_cache(build_cache_key(EVENT, "artist_field_Radiohead_youtube"))
+    assert cached["status"] == "error"
+    # Short negative TTL and no stale window
+    lifetime = _parse(cached["expires_at"]) - _parse(cached["cached_at"])
+    assert lifetime.total_seconds() == pytest.approx(Config.CACHE_FIELD_ERROR_TTL, abs=1)
+
+
+def test_failed_group_does_not_abort_the_stream(monkeypatch):
+    async def fake_run_json_prompt(prompt, tools, query_description=None, hedge_key=None, **kwargs):
+        if hedge_key == "music":
+            raise RuntimeError("boom")
+        return ANSWERS.get(hedge_key, {"youtube_url": "https://youtube.com/watch?v=1"})
+
+    monkeypatch.setattr(handler, "run_json_prompt", fake_run_json_prompt)
+    payloads = [json.loads(event["data"]) for event in _collect(["Radiohead"])]
+    values = {p["field"]: p["value"] for p in payloads if p["type"] == "artist_datapoint"}
+    assert values["music"]["error"].startswith("boom")
+    assert values["youtube"]["url"] == "https://youtube.com/watch?v=1"
+    assert payloads[-1] == {"type": "complete"}
+
+
+def test_artist_tier_value_beats_event_error(monkeypatch):
+    """A negative-cached failure for one event yields to a good value another event cached since."""
+    youtube = {"youtube_url": "https://youtube.com/@radiohead"}
+
+    async def failing_youtube(prompt, tools, query_description=None, hedge_key=None, **kwargs):
+        if hedge_key == "youtube":
+            raise RuntimeError("boom")
+        return ANSWERS[hedge_key]
+
+    async def working_youtube(prompt, tools, query_description=None, hedge_key=None, **kwargs):
+        return youtube if hedge_key == "youtube" else ANSWERS[hedge_key]
+
+    def youtube_value(event):
+        async def run():
+            return [item async for item in handler.artists_fields_handler(event, ["Radiohead"], client=object())]
+        payloads = [json.loads(item["data"]) for item in asyncio.run(run())]
+        return next(p["value"] for p in payloads if p["type"] == "artist_datapoint" and p["field"] == "youtube")
+
+    monkeypatch.setattr(handler, "run_json_prompt", failing_youtube)
+    assert "error" in youtube_value(EVENT)
+
+    monkeypatch.setattr(handler, "run_json_prompt", working_youtube)
+    other_event = {**EVENT, "date": "2099-02-01", "venue": "The Fillmore"}
+    assert youtube_value(other_event)["url"] == youtube["youtube_url"]
+
+    # Fully cached for EVENT now: the event-tier error must not win over the artist tier
+    monkeypatch.setattr(handler, "run_json_prompt", failing_youtube)
+    assert youtube_value(EVENT)["url"] == youtube["youtube_url"]
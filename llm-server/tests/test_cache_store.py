@@ -0,0 +1,93 @@
+"""Tests for the in-memory LRU cache backend (core/cache_store.py)."""
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to path so we can import from core
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.cache_store import CacheBackend, MemoryLruCacheBackend
+
+
+class DictBackend(CacheBackend):
+    """Underlying store that counts reads."""
+
+    def __init__(self):
+        self.data = {}
+        self.reads = 0
+
+    def get(self, key):
+        self.reads += 1
+        return self.data.get(key)
+
+    def set(self, key, payload):
+        self.data[key] = payload
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def purge(self, expires_before, event_date_before):
+        return 0
+
+    def close(self):
+        pass
+
+
+def _entry(key: str, size: int = 10):
+    return {"key": key, "value": "x" * size}
+
+
+def test_evicts_least_recently_used_over_entry_limit():
+    backend = DictBackend()
+    lru = MemoryLruCacheBackend(backend, max_entries=2, max_bytes=1 << 20)
+    lru.set("a", _entry("a"))
+    lru.set("b", _entry("b"))
+    assert lru.get("a") == _entry("a")  # "a" is now the most recently used
+    lru.set("c", _entry("c"))
+
+    stats = lru.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    backend.reads = 0
+    assert lru.get("a") == _entry("a")
+    assert lru.get("c") == _entry("c")
+    assert backend.reads == 0
+    # "b" was evicted from memory but is still served from the underlying backend
+    assert lru.get("b") == _entry("b")
+    assert backend.reads == 1
+
+
+def test_evicts_over_byte_limit():
+    size = len(json.dumps(_entry("a", 100)))
+    lru = MemoryLruCacheBackend(DictBackend(), max_entries=100, max_bytes=size * 2)
+    for key in ("a", "b", "c"):
+        lru.set(key, _entry(key, 100))
+    stats = lru.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= size * 2
+    assert stats["evictions"] == 1
+
+
+def test_oversized_entries_bypass_memory():
+    backend = DictBackend()
+    lru = MemoryLruCacheBackend(backend, max_entries=10, max_bytes=50)
+    lru.set("big", _entry("big", 100))
+    assert lru.stats()["entries"] == 0
+    assert lru.get("big") == _entry("big", 100)
+    assert backend.reads == 1
+
+
+def test_returned_entries_are_copies():
+    lru = MemoryLruCacheBackend(DictBackend(), max_entries=10, max_bytes=1 << 20)
+    lru.set("a", _entry("a"))
+    lru.get("a")["value"] = "mutated"
+    assert lru.get("a") == _entry("a")
+
+
+def test_delete_forgets_memory_entry():
+    backend = DictBackend()
+    lru = MemoryLruCacheBackend(backend, max_entries=10, max_bytes=1 << 20)
+    lru.set("a", _entry("a"))
+    lru.delete("a")
+    assert lru.get("a") is None
+    assert lru.stats()["bytes"] == 0
@@ -0,0 +1,138 @@
+"""Tests for the pinned page fetcher (core/fetcher.py)."""
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path so we can import from core
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.fetcher as fetcher
+import core.page_cache as page_cache
+
+
+PAGE = b"<html><body><p>Hello from %s</p></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def isolated_fetcher(monkeypatch):
+    monkeypatch.setattr(page_cache, "_page_cache", None)
+    monkeypatch.setattr(fetcher, "_client", None)
+    monkeypatch.setattr(fetcher, "_client_loop", None)
+
+
+async def _serve(connections: list, hosts: list, page: bytes = PAGE):
+    """Keep-alive HTTP server on 127.0.0.1 that records connections and Host headers."""
+    async def handle(reader, writer):
+        connections.append(writer.get_extra_info("peername"))
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            host = next(
+                line.split(b":", 1)[1].strip() for line in head.split(b"\r\n")
+                if line.lower().startswith(b"host:")
+            )
+            hosts.append(host.decode())
+            body = page % host
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+            await writer.drain()
+
+    async def safe_handle(reader, writer):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(safe_handle, "127.0.0.1", 0)
+
+
+def test_connects_to_validated_ip_and_pools_per_hostname(monkeypatch):
+    """Hostnames sharing an address get their own connections; URLs keep the hostname."""
+    resolved = []
+
+    async def fake_resolve(hostname):
+        resolved.append(hostname)
+        return "127.0.0.1", ""
+
+    monkeypatch.setattr(fetcher, "resolve_safe_host", fake_resolve)
+
+    async def run():
+        connections, hosts = [], []
+        server = await _serve(connections, hosts)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            first = await fetcher.fetch_page_text(f"http://a.example.test:{port}/one")
+            second = await fetcher.fetch_page_text(f"http://b.example.test:{port}/one")
+            again = await fetcher.fetch_page_text(f"http://a.example.test:{port}/two")
+        finally:
+            await fetcher.close_fetch_client()
+            server.close()
+            await server.wait_closed()
+        return first, second, again, connections, hosts
+
+    first, second, again, connections, hosts = asyncio.run(run())
+    assert "Hello from a.example.test" in first
+    assert "Hello from b.example.test" in second
+    assert "Hello from a.example.test" in again
+    assert [h.split(":")[0] for h in hosts] == ["a.example.test", "b.example.test", "a.example.test"]
+    # b.example.test didn't reuse a.example.test's connection; a's second request did
+    assert len(connections) == 2
+    assert resolved == ["a.example.test", "b.example.test"]
+
+
+def test_blocked_host_is_never_dialed(monkeypatch):
+    async def fake_resolve(hostname):
+        return None, "Blocked private IP address: 10.0.0.1"
+
+    monkeypatch.setattr(fetcher, "resolve_safe_host", fake_resolve)
+
+    async def run():
+        try:
+            with pytest.raises(ValueError, match="Blocked private IP"):
+                await fetcher.fetch_page_text("http://internal.example.test/")
+        finally:
+            await fetcher.close_fetch_client()
+
+    asyncio.run(run())
+
+
+def test_large_pages_are_parsed_off_the_event_loop(monkeypatch):
+    """Parsing happens in batches in worker threads, and reading stops once there is enough text."""
+    async def fake_resolve(hostname):
+        return "127.0.0.1", ""
+
+    blocking_calls = []
+    real_run_blocking = fetcher.run_blocking
+
+    async def recording_run_blocking(func, *args, **kwargs):
+        blocking_calls.append(func.__name__)
+        return await real_run_blocking(func, *args, **kwargs)
+
+    monkeypatch.setattr(fetcher, "resolve_safe_host", fake_resolve)
+    monkeypatch.setattr(fetcher, "run_blocking", recording_run_blocking)
+    paragraph = b"<p>" + b"word " * 200 + b"</p>"
+    page = b"<html><body><h1>%s</h1>" + paragraph * 2000 + b"</body></html>"
+
+    async def run():
+        server = await _serve([], [], page)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await fetcher.fetch_page_text(f"http://big.example.test:{port}/", max_chars=1000)
+        finally:
+            await fetcher.close_fetch_client()
+            server.close()
+            await server.wait_closed()
+
+    text = asyncio.run(run())
+    assert text.startswith("big.example.test")
+    assert text.endswith(fetcher.TRUNCATION_MARKER)
+    assert blocking_calls[0] == "feed"
+    assert blocking_calls[-1] == "_finish_extraction"
+    # 2MB page, but reading stopped after the first batch had enough text
+    assert blocking_calls.count("feed") == 1
@@ -0,0 +1,117 @@
+"""Tests for request hedging (core/hedging.py)."""
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path so we can import from core
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.scheduler as scheduler
+from core.config import Config
+from core.hedging import Hedger
+
+
+@pytest.fixture(autouse=True)
+def hedge_config(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_HEDGE_ENABLED", True)
+    monkeypatch.setattr(Config, "LLM_HEDGE_MIN_SAMPLES", 5)
+    monkeypatch.setattr(Config, "LLM_HEDGE_MIN_DELAY", 0.0)
+    monkeypatch.setattr(Config, "LLM_HEDGE_PERCENTILE", 95)
+    monkeypatch.setattr(Config, "LLM_HEDGE_BUDGET_RATIO", 0.5)
+    monkeypatch.setattr(scheduler, "_scheduler", scheduler.LLMScheduler(4))
+
+
+def _warm_up(hedger: Hedger, key: str, seconds: float = 0.02, samples: int = 5):
+    for _ in range(samples):
+        hedger._tracker(key).record(seconds)
+
+
+def test_no_hedging_until_enough_samples():
+    hedger = Hedger()
+    _warm_up(hedger, "youtube", samples=4)
+    assert hedger.hedge_delay("youtube") is None
+    hedger._tracker("youtube").record(0.02)
+    assert hedger.hedge_delay("youtube") == pytest.approx(0.02)
+
+
+def test_slow_call_is_hedged_and_hedge_wins():
+    hedger = Hedger()
+    _warm_up(hedger, "youtube")
+    attempts = []
+
+    async def call():
+        attempts.append(len(attempts))
+        # The primary is stuck, the hedge answers quickly
+        await asyncio.sleep(1.0 if len(attempts) == 1 else 0.01)
+        return len(attempts)
+
+    result = asyncio.run(hedger.run("youtube", call))
+    assert result == 2
+    assert (hedger.hedges, hedger.hedge_wins) == (1, 1)
+
+
+def test_budget_caps_hedges():
+    hedger = Hedger()
+    _warm_up(hedger, "music", seconds=0.01, samples=100)
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def scenario():
+        for _ in range(4):
+            await hedger.run("music", slow)
+
+    asyncio.run(scenario())
+    # Budget ratio 0.5: never more hedges than half the primaries at the time of the hedge
+    assert hedger.primaries == 4
+    assert hedger.hedges == 2
+    assert hedger.skipped_budget == 2
+
+
+def test_no_hedge_while_scheduler_is_saturated():
+    hedger = Hedger()
+    _warm_up(hedger, "website", seconds=0.01)
+    sched = scheduler.get_llm_scheduler()
+
+    async def scenario():
+        sched.max_concurrency = 1
+        await sched.acquire(scheduler.PRIORITY_FIELDS)
+        queued = asyncio.create_task(sched.acquire(scheduler.PRIORITY_FIELDS))
+        await asyncio.sleep(0)
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        assert await hedger.run("website", slow) == "ok"
+        sched.release()
+        await queued
+        sched.release()
+
+    asyncio.run(scenario())
+    assert hedger.hedges == 0
+    assert hedger.skipped_busy == 1
+
+
+def test_latency_excludes_scheduler_queueing():
+    hedger = Hedger()
+    sched = scheduler.get_llm_scheduler()
+
+    async def scenario():
+        sched.max_concurrency = 1
+        await sched.acquire(scheduler.PRIORITY_QUICK)
+        asyncio.get_running_loop().call_later(0.2, sched.release)
+
+        async def call():
+            # Queued ~0.2s for a slot, then served in ~0.01s
+            async with sched.slot(scheduler.PRIORITY_FIELDS):
+                await asyncio.sleep(0.01)
+
+        await hedger.run("bio_genres", call)
+
+    asyncio.run(scenario())
+    (latency,) = hedger._tracker("bio_genres").samples
+    assert latency < 0.1
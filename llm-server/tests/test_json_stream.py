@@ -0,0 +1,69 @@
+"""Tests for incremental JSON parsing of streamed answers (core/json_stream.py)."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path so we can import from core
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.json_stream import StreamingJSONObject
+
+
+def _feed(text: str, chunk_size: int = 1) -> StreamingJSONObject:
+    parser = StreamingJSONObject()
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i:i + chunk_size])
+    return parser
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_values_complete_independently_of_chunking(chunk_size):
+    parser = _feed('{"platform": "Spotify", "url": "https://open.spotify.com/artist/1", "count": 3}', chunk_size)
+    assert parser.values == {"platform": "Spotify", "url": "https://open.spotify.com/artist/1", "count": 3}
+    assert parser.closed
+
+
+def test_string_value_is_available_at_its_closing_quote():
+    parser = _feed('{"youtube_url": "https://youtube.com/@band", "notes": "still wri')
+    assert parser.values == {"youtube_url": "https://youtube.com/@band"}
+    assert parser.has_values(["youtube_url"])
+    assert not parser.has_values(["youtube_url", "notes"])
+    assert not parser.closed
+
+
+def test_escaped_quotes_do_not_end_strings():
+    parser = _feed(r'{"label": "The \"Real\" Band", "url": "https://x.test/a\\"}')
+    assert parser.values == {"label": 'The "Real" Band', "url": "https://x.test/a\\"}
+
+
+def test_nested_values_complete_at_the_top_level_separator():
+    parser = _feed('{"links": {"a": "1", "b": ["x", "y"]}, "url": "u"')
+    assert parser.values == {"links": {"a": "1", "b": ["x", "y"]}, "url": "u"}
+    # Keys inside the nested object are not top-level values
+    assert "a" not in parser.values
+
+
+def test_null_and_not_found_values():
+    parser = _feed('{"url": null, "label": "not_found"}')
+    assert parser.values == {"url": None, "label": "not_found"}
+    # null is a complete value but doesn't count as an answer
+    assert not parser.has_values(["url"])
+    assert parser.has_values(["label"])
+
+
+def test_code_fence_before_the_object_is_skipped():
+    parser = _feed('```json\n{"platform": "Bandcamp", "url": "https://band.bandcamp.com"}\n```')
+    assert parser.values == {"platform": "Bandcamp", "url": "https://band.bandcamp.com"}
+    assert parser.closed
+
+
+def test_text_after_the_object_is_ignored():
+    parser = _feed('{"url": "u"} and then {"url": "other"}')
+    assert parser.values == {"url": "u"}
+    assert parser.closed
+
+
+def test_malformed_values_are_left_out():
+    parser = _feed('{"url": nope, "label": "ok"}')
+    assert parser.values == {"label": "ok"}
@@ -0,0 +1,169 @@
+"""Tests for OpenAI call retries and scheduler slot handling (core/llm_limits.py, core/llm.py)."""
+import sys
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import APIConnectionError, BadRequestError, InternalServerError, RateLimitError
+
+# Add parent directory to path so we can import from core
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.llm_limits as llm_limits
+import core.scheduler as scheduler
+from core.config import Config
+from core.llm import create_chat_completion
+
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def _status_error(cls, status: int):
+    return cls("error", response=httpx.Response(status, request=_REQUEST), body=None)
+
+
+class FakeCompletions:
+    """Raises the queued errors in order, then returns a completion."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(usage=SimpleNamespace(total_tokens=10))
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(Config, "OPENAI_BACKOFF_BASE", 0.05)
+    monkeypatch.setattr(Config, "OPENAI_MAX_RETRIES", 2)
+    monkeypatch.setattr(llm_limits, "_limiters", {})
+    monkeypatch.setattr(scheduler, "_scheduler", scheduler.LLMScheduler(1))
+
+
+def _run(completions):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return asyncio.run(create_chat_completion(
+        client, scheduler.PRIORITY_FIELDS, model="gpt-test", messages=[{"role": "user", "content": "hi"}], max_tokens=5
+    ))
+
+
+def test_transient_errors_are_retried():
+    completions = FakeCompletions([APIConnectionError(request=_REQUEST), _status_error(InternalServerError, 500)])
+    result = _run(completions)
+    assert result.usage.total_tokens == 10
+    assert completions.calls == 3
+
+
+def test_non_transient_errors_are_not_retried():
+    completions = FakeCompletions([_status_error(BadRequestError, 400)])
+    with pytest.raises(BadRequestError):
+        _run(completions)
+    assert completions.calls == 1
+
+
+def test_persistent_429_raises_rate_limited():
+    completions = FakeCompletions([_status_error(RateLimitError, 429) for _ in range(3)])
+    with pytest.raises(llm_limits.LLMRateLimited):
+        _run(completions)
+    assert completions.calls == 3
+
+
+def test_backoff_does_not_hold_a_scheduler_slot():
+    async def scenario():
+        throttled = FakeCompletions([_status_error(RateLimitError, 429)])
+        client = SimpleNamespace(chat=SimpleNamespace(completions=throttled))
+        backing_off = asyncio.create_task(create_chat_completion(
+            client, scheduler.PRIORITY_FIELDS, model="gpt-test", messages=[], max_tokens=5
+        ))
+        await asyncio.sleep(0.01)
+        # The only slot is free while the throttled call sleeps, so a quick call runs right away
+        assert scheduler.get_llm_scheduler().active == 0
+        quick = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions([])))
+        await asyncio.wait_for(create_chat_completion(
+            quick, scheduler.PRIORITY_QUICK, model="gpt-quick", messages=[], max_tokens=5
+        ), timeout=0.02)
+        await backing_off
+        assert throttled.calls == 2
+
+    asyncio.run(scenario())
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.chunks:
+            raise StopAsyncIteration
+        return self.chunks.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeStreamingCompletions:
+    """Streams two content chunks and a final usage chunk (as with include_usage)."""
+
+    def __init__(self):
+        self.kwargs = None
+        self.streams = []
+
+    async def create(self, **kwargs):
+        self.kwargs = kwargs
+        delta = SimpleNamespace(content="hi", tool_calls=None)
+        chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None) for _ in range(2)]
+        chunks.append(SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=10)))
+        self.streams.append(FakeStream(chunks))
+        return self.streams[-1]
+
+
+def _open_stream(completions, priority=scheduler.PRIORITY_FIELDS):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return create_chat_completion(
+        client, priority, model="gpt-test", messages=[{"role": "user", "content": "hi"}], max_tokens=1000, stream=True
+    )
+
+
+def test_stream_holds_slot_until_consumed_and_reconciles_usage():
+    async def scenario():
+        completions = FakeStreamingCompletions()
+        stream = await _open_stream(completions)
+        assert completions.kwargs["stream_options"] == {"include_usage": True}
+        assert scheduler.get_llm_scheduler().active == 1
+        chunks = [chunk async for chunk in stream]
+        assert len(chunks) == 3
+        assert completions.streams[0].closed
+        assert scheduler.get_llm_scheduler().active == 0
+        limiter = llm_limits.get_model_limiter("gpt-test")
+        # Only the 10 tokens actually used stay charged, not the 1000+ estimate
+        assert limiter.tokens.capacity - limiter.tokens.tokens == pytest.approx(10, abs=5)
+
+    asyncio.run(scenario())
+
+
+def test_closing_a_stream_early_hands_the_slot_on():
+    async def scenario():
+        completions = FakeStreamingCompletions()
+        first = await _open_stream(completions)
+        waiting = asyncio.create_task(_open_stream(completions, scheduler.PRIORITY_QUICK))
+        await asyncio.sleep(0.01)
+        # The only slot is held while the first stream is being read
+        assert not waiting.done()
+        await first.__anext__()
+        await first.close()
+        second = await asyncio.wait_for(waiting, timeout=0.1)
+        assert completions.streams[0].closed
+        await second.close()
+        assert scheduler.get_llm_scheduler().active == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,95 @@
+"""Tests for the LLM call scheduler (core/scheduler.py)."""
+import sys
+import asyncio
+from pathlib import Path
+
+# Add parent directory to path so we can import from core
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.scheduler import LLMScheduler, PRIORITY_QUICK, PRIORITY_ARTISTS_LIST, PRIORITY_FIELDS, queue_wait
+
+
+def test_waiters_are_admitted_by_priority_rank_then_arrival():
+    async def scenario():
+        scheduler = LLMScheduler(1)
+        order = []
+
+        async def call(name, priority, rank):
+            async with scheduler.slot(priority, rank):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await scheduler.acquire(PRIORITY_FIELDS)
+        waiters = [
+            asyncio.create_task(call("fields-2", PRIORITY_FIELDS, 2)),
+            asyncio.create_task(call("fields-0-first", PRIORITY_FIELDS, 0)),
+            asyncio.create_task(call("artists", PRIORITY_ARTISTS_LIST, 5)),
+            asyncio.create_task(call("fields-0-second", PRIORITY_FIELDS, 0)),
+            asyncio.create_task(call("quick", PRIORITY_QUICK, 9)),
+        ]
+        await asyncio.sleep(0.01)
+        assert scheduler.has_waiters()
+        scheduler.release()
+        await asyncio.gather(*waiters)
+        return order, scheduler
+
+    order, scheduler = asyncio.run(scenario())
+    assert order == ["quick", "artists", "fields-0-first", "fields-0-second", "fields-2"]
+    assert scheduler.active == 0
+    assert not scheduler.has_waiters()
+
+
+def test_concurrency_cap():
+    async def scenario():
+        scheduler = LLMScheduler(2)
+        running = peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with scheduler.slot(PRIORITY_FIELDS):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        return peak, scheduler.active
+
+    assert asyncio.run(scenario()) == (2, 0)
+
+
+def test_cancelled_waiter_does_not_leak_its_slot():
+    async def scenario():
+        scheduler = LLMScheduler(1)
+        await scheduler.acquire(PRIORITY_FIELDS)
+        cancelled = asyncio.create_task(scheduler.acquire(PRIORITY_QUICK))
+        later = asyncio.create_task(scheduler.acquire(PRIORITY_FIELDS))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.wait_for(later, timeout=0.1)
+        scheduler.release()
+        return scheduler.active
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_queue_wait_is_accumulated_for_the_current_task():
+    async def scenario():
+        scheduler = LLMScheduler(1)
+        await scheduler.acquire(PRIORITY_FIELDS)
+
+        async def measured():
+            queued = [0.0]
+            queue_wait.set(queued)
+            async with scheduler.slot(PRIORITY_FIELDS):
+                pass
+            return queued[0]
+
+        task = asyncio.create_task(measured())
+        await asyncio.sleep(0.05)
+        scheduler.release()
+        return await task
+
+    assert asyncio.run(scenario()) >= 0.04